@@ -19,38 +19,40 @@ a pair as a tuple and removes them from the dictionary.
 dict_name.items() is a dictionary method which returns an object view of that display\ return a list of pairs for key: value. e.g. unsorted_dict = {'o':90, 'k':1, 'gg':12}
 print(unsorted_dict.items()) ==>Obj viewed list:  dict_items([('a', 1), ('b', 66), ('k', 0)])
 """
-# define dictionaries 
-m_dict = {'apple':5, 'grape':6}
-#in place(mutable)
-m_dict['apple'] = 10
-
-# Dict comprehensive: my_dict = {key: value for key, value in iterable}
-# key --> shopping item, value-->its index 
-item = ['veg', 'apple', 'milk']
-shopping = {item: index for index, item in enumerate(item)}
-print("Shopping list: ", shopping)
-# Initialize variables
-account_number, account_holder, balance = None, None, None # instead of 3 times None can use: [None] * 3
-test1 = {"account number": account_number, "account holder": account_holder, "balance": balance}
-print(test1)
-
-# Loop to update values
-for key in test1.keys():
-    value = input(f"Enter value for {key}: ")
-    test1[key] = value
-
-print(test1)
-
-#---------------------------------
-"""Word Frequency Counter:
-Write a program that takes a sentence as input and counts the frequency of each word in the sentence. 
-Store the word frequencies in a dictionary where the keys are the words and the values are the corresponding frequencies."""
-
-sentence = input("Enter a sentence: ")
-sentence_split = sentence.split()
-word_frequency = {}
-for word in sentence_split:
-    word_frequency[word] = word_frequency.get(word, 0)+1
-print(word_frequency)
-for word, count in word_frequency.items():
-    print(f"{word}: {count}")
\ No newline at end of file
+# Execute:
+if __name__ == "__main__":
+    # define dictionaries 
+    m_dict = {'apple':5, 'grape':6}
+    #in place(mutable)
+    m_dict['apple'] = 10
+
+    # Dict comprehensive: my_dict = {key: value for key, value in iterable}
+    # key --> shopping item, value-->its index 
+    item = ['veg', 'apple', 'milk']
+    shopping = {item: index for index, item in enumerate(item)}
+    print("Shopping list: ", shopping)
+    # Initialize variables
+    account_number, account_holder, balance = None, None, None # instead of 3 times None can use: [None] * 3
+    test1 = {"account number": account_number, "account holder": account_holder, "balance": balance}
+    print(test1)
+
+    # Loop to update values
+    for key in test1.keys():
+        value = input(f"Enter value for {key}: ")
+        test1[key] = value
+
+    print(test1)
+
+    #---------------------------------
+    """Word Frequency Counter:
+    Write a program that takes a sentence as input and counts the frequency of each word in the sentence. 
+    Store the word frequencies in a dictionary where the keys are the words and the values are the corresponding frequencies."""
+
+    sentence = input("Enter a sentence: ")
+    sentence_split = sentence.split()
+    word_frequency = {}
+    for word in sentence_split:
+        word_frequency[word] = word_frequency.get(word, 0)+1
+    print(word_frequency)
+    for word, count in word_frequency.items():
+        print(f"{word}: {count}")
\ No newline at end of file
@@ -1,7 +1,12 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+import itertools
+import time
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Tuple, ValuesView
+
+if TYPE_CHECKING:
+    from order_store import OrderStore
 
 
 # ---------------------------
@@ -22,8 +27,9 @@ class Product:
             raise ValueError("Quantity cannot be negative.")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CartItem:
+    """One cart/order line. Immutable, so carts and orders can share it safely."""
     product_name: str
     unit_price: float
     quantity: int
@@ -41,17 +47,53 @@ class OrderStatus(Enum):
     CANCELLED = auto()
 
 
-@dataclass
-class Order:
+class _StoreSlot:
+    # The OrderStore an order belongs to. A slot rather than a dataclass field,
+    # so asdict(), replace(), copies and pickles never carry the whole store along.
+    __slots__ = ("_store",)
+
+
+@dataclass(slots=True)
+class Order(_StoreSlot):
     order_id: int
     items: List[CartItem]
     subtotal: float
     discount: float
     total: float
     status: OrderStatus = OrderStatus.PENDING
+    created_at: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        # Set by order_store.OrderStore.add so status changes keep its indexes current
+        self._store = None
+
+    @property
+    def store(self) -> Optional[OrderStore]:
+        return self._store
+
+    def __getstate__(self):
+        # (no __dict__, slots): fields only; a copy starts outside any store
+        return None, {**{f.name: getattr(self, f.name) for f in fields(self)}, "_store": None}
 
     def set_status(self, status: OrderStatus) -> None:
+        old = self.status
         self.status = status
+        if self._store is not None:
+            self._store._status_changed(self, old)
+
+
+# Globally unique, increasing order ids (shared by all users)
+_order_ids = itertools.count(1)
+
+
+def next_order_id() -> int:
+    return next(_order_ids)
+
+
+def advance_order_ids(last_id: int) -> None:
+    """Make sure future ids are greater than `last_id` (e.g. after loading saved orders)."""
+    global _order_ids
+    _order_ids = itertools.count(max(last_id + 1, next(_order_ids)))
 
 
 # ---------------------------
@@ -94,6 +136,42 @@ class Inventory:
         p = self._products.get(name)
         return bool(p and p.quantity >= amount)
 
+    def reserve_batch(self, carts: Sequence[Mapping[str, int]]) -> List[bool]:
+        """
+        Reserve stock for many carts in a single pass.
+        Each cart is all-or-nothing: it is reserved only if every line fits in the
+        stock left over by the carts before it. Failed carts change nothing.
+        Demand is aggregated per product and written back once at the end.
+        Returns one success flag per cart, in order.
+        """
+        products = self._products
+        remaining: Dict[str, int] = {}
+        results: List[bool] = []
+
+        for cart in carts:
+            ok = True
+            for name, amount in cart.items():
+                if amount < 0:
+                    raise ValueError("Reserve amount must be non-negative.")
+                left = remaining.get(name)
+                if left is None:
+                    p = products.get(name)
+                    if p is None:
+                        ok = False
+                        break
+                    left = remaining[name] = p.quantity
+                if left < amount:
+                    ok = False
+                    break
+            if ok:
+                for name, amount in cart.items():
+                    remaining[name] -= amount
+            results.append(ok)
+
+        for name, left in remaining.items():
+            products[name].quantity = left
+        return results
+
     def _require(self, name: str) -> None:
         if name not in self._products:
             raise KeyError(f"Product '{name}' not found in inventory.")
@@ -107,41 +185,64 @@ class ShoppingCart:
 
     def __init__(self) -> None:
         self._items: Dict[str, CartItem] = {}
+        # Kept up to date by add/remove/clear so reading them is O(1)
+        self._subtotal = 0.0
+        self._units = 0
 
     def add(self, product: Product, quantity: int = 1) -> None:
         if quantity <= 0:
             raise ValueError("Quantity must be positive.")
-        if product.name in self._items:
-            self._items[product.name].quantity += quantity
+        current = self._items.get(product.name)
+        if current is not None:
+            self._items[product.name] = CartItem(current.product_name, current.unit_price, current.quantity + quantity)
+            self._subtotal += current.unit_price * quantity
         else:
             self._items[product.name] = CartItem(
                 product_name=product.name,
                 unit_price=product.price,
                 quantity=quantity,
             )
+            self._subtotal += product.price * quantity
+        self._units += quantity
 
     def remove(self, product_name: str, quantity: Optional[int] = None) -> None:
         """Remove a product entirely or decrease its quantity."""
-        if product_name not in self._items:
+        current = self._items.get(product_name)
+        if current is None:
             return
-        if quantity is None or quantity >= self._items[product_name].quantity:
+        if quantity is None or quantity >= current.quantity:
             del self._items[product_name]
+            quantity = current.quantity
         else:
-            self._items[product_name].quantity -= quantity
+            self._items[product_name] = CartItem(current.product_name, current.unit_price, current.quantity - quantity)
+        self._units -= quantity
+        # Reset on empty so floating-point drift cannot accumulate across carts
+        self._subtotal = self._subtotal - current.unit_price * quantity if self._items else 0.0
 
     def clear(self) -> None:
         self._items.clear()
+        self._subtotal = 0.0
+        self._units = 0
 
     @property
-    def items(self) -> List[CartItem]:
-        return list(self._items.values())
+    def items(self) -> ValuesView[CartItem]:
+        """Live, read-only view of the cart lines (no copy)."""
+        return self._items.values()
 
     @property
     def subtotal(self) -> float:
-        return sum(i.line_total for i in self._items.values())
+        return self._subtotal
+
+    @property
+    def units(self) -> int:
+        """Total number of units across all lines."""
+        return self._units
+
+    def __len__(self) -> int:
+        return len(self._items)
 
     def __repr__(self) -> str:
-        return f"ShoppingCart(items={self.items}, subtotal={self.subtotal:.2f})"
+        return f"ShoppingCart(items={list(self.items)}, subtotal={self.subtotal:.2f})"
 
 
 # ---------------------------
@@ -197,22 +298,43 @@ class User:
         for item in self.cart.items:
             inventory.decrease_stock(item.product_name, item.quantity)
 
-        # Compute totals & discounts
-        subtotal = self.cart.subtotal
-        discount = discount_engine(subtotal)
-        total = round(subtotal - discount, 2)
+        try:
+            return self._checkout(payment)
+        except RuntimeError:
+            # Payment failed: return the reserved stock
+            for item in self.cart.items:
+                inventory.increase_stock(item.product_name, item.quantity)
+            raise
+
+    def _checkout(self, payment: PaymentProcessor) -> Order:
+        """Charge for the (already reserved) cart, record the order and clear the cart."""
+        subtotal, discount, total = self._totals()
 
         # Charge payment
         charged = payment.charge(total, self.email)
         if not charged:
-            # If payment fails, return stock (not implemented in this mock)
             raise RuntimeError("Payment failed.")
 
-        # Create and save order
-        order_id = len(self.orders) + 1
+        return self._record_order(subtotal, discount, total)
+
+    def _totals(self) -> Tuple[float, float, float]:
+        """Compute (subtotal, discount, total) for the current cart."""
+        subtotal = self.cart.subtotal
+        discount = discount_engine(subtotal)
+        total = round(subtotal - discount, 2)
+        return subtotal, discount, total
+
+    def _record_order(self, subtotal: float, discount: float, total: float,
+                      items: Optional[List[CartItem]] = None) -> Order:
+        """
+        Create and save a PAID order from the current cart, then clear the cart.
+        With `items` (a snapshot taken before paying), the order is built from
+        those lines and only they are taken out of the cart.
+        """
+        order_id = next_order_id()
         order = Order(
             order_id=order_id,
-            items=[CartItem(i.product_name, i.unit_price, i.quantity) for i in self.cart.items],
+            items=list(self.cart.items) if items is None else items,  # CartItem is immutable: shared, not copied
             subtotal=round(subtotal, 2),
             discount=round(discount, 2),
             total=total,
@@ -221,13 +343,53 @@ class User:
         self.orders.append(order)
 
         # Clear cart after successful purchase
-        self.cart.clear()
+        if items is None:
+            self.cart.clear()
+        else:
+            for item in items:
+                self.cart.remove(item.product_name, item.quantity)
         return order
 
     def order_history(self) -> List[Order]:
         return self.orders
 
 
+def place_orders_bulk(
+    users: Sequence[User], inventory: Inventory, payment: PaymentProcessor
+) -> List[Optional[Order]]:
+    """
+    Place one order per user's cart, reserving stock for all carts in one pass.
+    Returns the new `Order` for each user, or None if the cart was empty,
+    could not be filled, or payment failed (its stock is then given back).
+    Any other error gives back the stock of that cart and of every cart
+    not processed yet, then propagates.
+    """
+    carts = [{item.product_name: item.quantity for item in user.cart.items} for user in users]
+    reserved = inventory.reserve_batch(carts)
+
+    results: List[Optional[Order]] = []
+    try:
+        for user, cart, ok in zip(users, carts, reserved):
+            if not ok or not cart:
+                results.append(None)
+                continue
+            try:
+                results.append(user._checkout(payment))
+            except RuntimeError:
+                for name, amount in cart.items():
+                    inventory.increase_stock(name, amount)
+                results.append(None)
+    except BaseException:
+        # results has one entry per finished cart: the rest still hold their reservation
+        done = len(results)
+        for cart, ok in zip(carts[done:], reserved[done:]):
+            if ok:
+                for name, amount in cart.items():
+                    inventory.increase_stock(name, amount)
+        raise
+    return results
+
+
 # ---------------------------
 # Demo (safe to run)
 # ---------------------------
@@ -0,0 +1,298 @@
+"""
+⚡ Asyncio checkout with a pooled, retrying payment processor
+------------------------------------------------------------
+`PaymentProcessor.charge` is synchronous: a real gateway call (tens of ms)
+would block `place_order` from start to finish. Here the network wait is
+`await`-ed instead, so thousands of checkouts can overlap it.
+
+`AsyncPaymentProcessor` adds what a real client needs:
+- a bounded pool: at most `max_concurrency` gateway calls in flight
+- timeouts per gateway call
+- retry with exponential backoff (+ jitter) on transient errors. Every
+  charge carries an idempotency key and retries reuse it, so a call that
+  timed out but did go through is never charged a second time
+- batching: charges that arrive within `batch_window` seconds are sent
+  together in one gateway request (up to `batch_size`)
+
+`FakeGateway` stands in for the real service, with configurable latency,
+transient failure rate and decline rate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from OOP3_Online_Shopping2 import Inventory, Order, Product, User
+
+
+# ---------------------------
+# Fake payment gateway
+# ---------------------------
+
+class FakeGateway:
+    """
+    Local stand-in for a payment API. Like real gateways it makes each
+    idempotency key's charge at most once; a repeated key gets the first outcome.
+    """
+
+    def __init__(self, latency: float = 0.02, failure_rate: float = 0.0,
+                 decline_rate: float = 0.0, lost_reply_rate: float = 0.0, seed: Optional[int] = None) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate    # whole request fails (retryable)
+        self.decline_rate = decline_rate    # single charge declined (final)
+        self.lost_reply_rate = lost_reply_rate  # charges made, but the reply never arrives
+        self.calls = 0
+        self.charged: Dict[str, float] = {}     # idempotency key -> amount actually charged
+        self._outcomes: Dict[str, bool] = {}
+        self._rng = random.Random(seed)
+
+    async def charge_batch(self, charges: List[Tuple[float, str, str]]) -> List[bool]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self._rng.random() < self.failure_rate:
+            raise ConnectionError("Gateway unavailable.")
+        results = []
+        for amount, _, key in charges:
+            ok = self._outcomes.get(key)
+            if ok is None:
+                ok = self._outcomes[key] = self._rng.random() >= self.decline_rate
+                if ok:
+                    self.charged[key] = amount
+            results.append(ok)
+        if self._rng.random() < self.lost_reply_rate:
+            await asyncio.Event().wait()        # hangs until the client times out
+        return results
+
+
+# ---------------------------
+# Async payment processor
+# ---------------------------
+
+class PaymentPending(Exception):
+    """
+    The gateway did not answer in time, so the charge may or may not have
+    been made. Charging again with the same idempotency key is safe and
+    returns the real outcome.
+    """
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"Outcome of charge {key} unknown (gateway timed out).")
+        self.key = key
+
+
+class AsyncPaymentProcessor:
+    """Batching, bounded, retrying async client for a payment gateway."""
+
+    def __init__(self, gateway: FakeGateway, max_concurrency: int = 64, timeout: float = 1.0,
+                 retries: int = 3, backoff: float = 0.05,
+                 batch_size: int = 50, batch_window: float = 0.002) -> None:
+        self.gateway = gateway
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._pending: List[Tuple[float, str, str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def charge(self, amount: float, user_email: str, idempotency_key: Optional[str] = None) -> bool:
+        """
+        Queue a charge and wait for its result (False if declined, or if the
+        gateway refused every attempt). Raises `PaymentPending` when a timed-out
+        attempt may have gone through; pass the same `idempotency_key` again
+        to learn the outcome without charging twice.
+        """
+        if amount < 0:
+            raise ValueError("Charge amount cannot be negative.")
+        key = uuid.uuid4().hex if idempotency_key is None else idempotency_key
+        loop = asyncio.get_running_loop()
+        result = loop.create_future()
+        self._pending.append((amount, user_email, key, result))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await result
+
+    async def join(self) -> None:
+        """Wait until every batch in flight and every background settlement is done."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _track(self, coro: Awaitable) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)                  # keep a reference until done
+        task.add_done_callback(self._tasks.discard)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self._track(self._send(batch))
+
+    async def _send(self, batch: List[Tuple[float, str, str, asyncio.Future]]) -> None:
+        # Retries resend the same idempotency keys: a charge made by an attempt
+        # that timed out is reported, not made again
+        charges = [(amount, email, key) for amount, email, key, _ in batch]
+        results: List[bool] = []
+        timed_out = False
+        error: Optional[BaseException] = None
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    async with self._slots:
+                        results = await asyncio.wait_for(self.gateway.charge_batch(charges), self.timeout)
+                    break
+                except (ConnectionError, asyncio.TimeoutError) as exc:
+                    timed_out = timed_out or isinstance(exc, asyncio.TimeoutError)
+                    if attempt == self.retries:
+                        break
+                    await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + random.random()))
+        except BaseException as exc:
+            # Any other error fails the whole batch; the callers' futures get it,
+            # so nobody awaiting `charge` is left hanging
+            error = exc
+            if not isinstance(exc, Exception):
+                raise                          # cancellation, KeyboardInterrupt, ...
+        finally:
+            for i, (_, _, key, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if error is None and not results and timed_out:
+                    future.set_exception(PaymentPending(key))
+                elif error is None:
+                    future.set_result(i < len(results) and bool(results[i]))
+                elif isinstance(error, Exception):
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+
+
+# ---------------------------
+# Async order placement
+# ---------------------------
+
+async def place_order(user: User, inventory: Inventory, payment: AsyncPaymentProcessor) -> Order:
+    """
+    Async version of `User.place_order`.
+    Stock is reserved before the first `await`, so no other coroutine can
+    interleave with the check-then-decrease. The cart is snapshotted then too:
+    the order is exactly what was reserved and charged, even if the cart
+    changes while payment is pending. If payment fails the stock is returned.
+
+    If the outcome of the charge is unknown when this returns (`PaymentPending`,
+    or the caller is cancelled while the gateway call is in flight), the stock
+    stays reserved and the order is settled in the background: the charge is
+    repeated with the same idempotency key until the gateway answers, then the
+    order is recorded (charged) or the stock returned (not charged).
+    """
+    items = list(user.cart.items)
+    cart = {i.product_name: i.quantity for i in items}
+    if not cart:
+        raise ValueError("Cart is empty.")
+    if not inventory.reserve_batch([cart])[0]:
+        raise ValueError("Insufficient stock.")
+
+    subtotal, discount, total = user._totals()
+    key = uuid.uuid4().hex                     # one per order, reused by every retry
+
+    def settle(charged: bool) -> Optional[Order]:
+        if charged:
+            return user._record_order(subtotal, discount, total, items)
+        for name, amount in cart.items():
+            inventory.increase_stock(name, amount)
+        return None
+
+    charge = asyncio.ensure_future(payment.charge(total, user.email, key))
+    try:
+        charged = await asyncio.shield(charge)
+    except (asyncio.CancelledError, PaymentPending):
+        payment._track(_settle_later(charge, payment, total, user.email, key, settle))
+        raise
+    except BaseException:
+        settle(False)
+        raise
+    order = settle(charged)
+    if order is None:
+        raise RuntimeError("Payment failed.")
+    return order
+
+
+async def _settle_later(charge: asyncio.Future, payment: AsyncPaymentProcessor, amount: float,
+                        user_email: str, key: str, settle: Callable[[bool], Optional[Order]]) -> None:
+    """Wait for (or ask again for) the outcome of charge `key`, then settle its order."""
+    try:
+        charged: Optional[bool] = await charge
+    except PaymentPending:
+        charged = None
+    except Exception:
+        charged = False
+    while charged is None:
+        try:
+            charged = await payment.charge(amount, user_email, key)
+        except PaymentPending:
+            pass
+    settle(charged)
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+async def benchmark(checkouts: int = 2_000, latency: float = 0.02, failure_rate: float = 0.05,
+                    decline_rate: float = 0.05, lost_reply_rate: float = 0.02) -> None:
+    """Run many concurrent checkouts; verify stock is conserved and nobody is charged twice."""
+    inventory = Inventory()
+    initial = {f"P{i}": 10 * checkouts for i in range(20)}
+    for name, qty in initial.items():
+        inventory.add_product(Product(name, 5.0, qty, "Misc"))
+
+    rng = random.Random(1)
+    users = []
+    for u in range(checkouts):
+        user = User(f"user{u}", f"user{u}@shop.com", "Somewhere 1")
+        for _ in range(rng.randint(1, 3)):
+            user.cart.add(inventory.get(f"P{rng.randrange(20)}"), rng.randint(1, 4))
+        users.append(user)
+
+    gateway = FakeGateway(latency=latency, failure_rate=failure_rate, decline_rate=decline_rate,
+                          lost_reply_rate=lost_reply_rate, seed=2)
+    payment = AsyncPaymentProcessor(gateway, timeout=10 * latency)
+
+    t0 = time.perf_counter()
+    results = await asyncio.gather(
+        *(place_order(user, inventory, payment) for user in users), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - t0
+    await payment.join()                       # orders whose charge was still pending
+    pending = sum(isinstance(r, PaymentPending) for r in results)
+
+    # Settled in the background or not, every placed order is in its user's orders
+    orders = [order for user in users for order in user.orders]
+    sold = {name: 0 for name in initial}
+    for order in orders:
+        for item in order.items:
+            sold[item.product_name] += item.quantity
+    conserved = all(inventory.get(n).quantity == initial[n] - sold[n] for n in initial)
+    charged_once = (len(gateway.charged) == len(orders)
+                    and abs(sum(gateway.charged.values()) - sum(o.total for o in orders)) < 1e-6)
+
+    print(f"Checkouts: {checkouts:,}  gateway latency {latency * 1e3:.0f} ms, failure {failure_rate:.0%}, "
+          f"decline {decline_rate:.0%}, lost replies {lost_reply_rate:.0%}")
+    print(f"  async         : {elapsed:6.2f}s  ({checkouts / elapsed:8,.0f} orders/s), "
+          f"{gateway.calls} gateway calls, {len(orders):,} placed ({pending} settled later)")
+    print(f"  sync (approx.): {checkouts * latency:6.2f}s  ({1 / latency:8,.0f} orders/s)")
+    print(f"  stock conserved (failed payments returned stock): {conserved}")
+    print(f"  every order charged exactly once: {charged_once}")
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
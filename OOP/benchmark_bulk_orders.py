@@ -0,0 +1,89 @@
+"""
+⏱️ Benchmark: place_orders_bulk vs a loop over User.place_order
+---------------------------------------------------------------
+Simulates a flash sale: many users, each with a small cart drawn from a
+shared catalog. Both paths start from identical inventories and must end
+with identical stock levels.
+"""
+
+import random
+import time
+
+from OOP3_Online_Shopping2 import Inventory, PaymentProcessor, Product, User, place_orders_bulk
+
+
+def build(n_users: int, n_products: int = 200, seed: int = 0):
+    rng = random.Random(seed)
+    inventory = Inventory()
+    for i in range(n_products):
+        inventory.add_product(Product(f"P{i}", round(rng.uniform(1, 50), 2), rng.randint(0, n_users // 10), "Misc"))
+
+    users = []
+    for u in range(n_users):
+        user = User(f"user{u}", f"user{u}@shop.com", "Somewhere 1")
+        for _ in range(rng.randint(1, 4)):
+            user.cart.add(inventory.get(f"P{rng.randrange(n_products)}"), rng.randint(1, 3))
+        users.append(user)
+    return inventory, users
+
+
+def reserve_loop(inventory: Inventory, carts) -> list:
+    """What place_order does per cart: check every line, then decrease every line."""
+    results = []
+    for cart in carts:
+        ok = all(inventory.has_stock(name, amount) for name, amount in cart.items())
+        if ok:
+            for name, amount in cart.items():
+                inventory.decrease_stock(name, amount)
+        results.append(ok)
+    return results
+
+
+def run(n_users: int = 50_000) -> None:
+    payment = PaymentProcessor()
+
+    # Reservation only
+    inventory_loop, users = build(n_users)
+    inventory_bulk, _ = build(n_users)
+    carts = [{i.product_name: i.quantity for i in user.cart.items} for user in users]
+    t0 = time.perf_counter()
+    reserved_loop = reserve_loop(inventory_loop, carts)
+    t_reserve_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    reserved_bulk = inventory_bulk.reserve_batch(carts)
+    t_reserve_bulk = time.perf_counter() - t0
+    print(f"Reservation only ({n_users:,} carts)")
+    print(f"  has_stock/decrease_stock loop: {t_reserve_loop:6.3f}s")
+    print(f"  reserve_batch                : {t_reserve_bulk:6.3f}s  (x{t_reserve_loop / t_reserve_bulk:.1f})")
+    print(f"  same results: {reserved_loop == reserved_bulk}")
+
+    # End to end (totals, payment, order records included)
+    inventory_loop, users_loop = build(n_users)
+    t0 = time.perf_counter()
+    ok_loop = 0
+    for user in users_loop:
+        try:
+            user.place_order(inventory_loop, payment)
+            ok_loop += 1
+        except ValueError:
+            pass
+    t_loop = time.perf_counter() - t0
+
+    inventory_bulk, users_bulk = build(n_users)
+    t0 = time.perf_counter()
+    results = place_orders_bulk(users_bulk, inventory_bulk, payment)
+    t_bulk = time.perf_counter() - t0
+    ok_bulk = sum(order is not None for order in results)
+
+    same_stock = all(
+        inventory_loop.get(name).quantity == inventory_bulk.get(name).quantity
+        for name in inventory_loop._products
+    )
+    print(f"\nEnd to end ({n_users:,} checkouts)")
+    print(f"  place_order loop : {t_loop:6.3f}s  ({n_users / t_loop:10,.0f} carts/s)  placed {ok_loop:,}")
+    print(f"  place_orders_bulk: {t_bulk:6.3f}s  ({n_users / t_bulk:10,.0f} carts/s)  placed {ok_bulk:,}")
+    print(f"  same results: {ok_loop == ok_bulk and same_stock}")
+
+
+if __name__ == "__main__":
+    run()
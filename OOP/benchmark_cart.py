@@ -0,0 +1,66 @@
+"""
+⏱️ Micro-benchmark: ShoppingCart subtotal and CartItem memory
+------------------------------------------------------------
+Compares the current cart (incremental subtotal, slotted frozen CartItem)
+with the previous design (subtotal re-summed and items list copied on every
+access, plain dataclass CartItem).
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from OOP3_Online_Shopping2 import CartItem, Product, ShoppingCart
+
+
+@dataclass
+class PlainCartItem:
+    """The previous CartItem: a regular (dict-backed) dataclass."""
+    product_name: str
+    unit_price: float
+    quantity: int
+
+    @property
+    def line_total(self) -> float:
+        return self.unit_price * self.quantity
+
+
+def bytes_per_item(cls, n: int = 100_000) -> float:
+    names = [f"P{i}" for i in range(n)]
+    tracemalloc.start()
+    items = [cls(name, 1.5, 2) for name in names]
+    used = tracemalloc.get_traced_memory()[0] - sys.getsizeof(items)
+    tracemalloc.stop()
+    return used / n
+
+
+def run(lines: int = 5_000, reads: int = 1_000) -> None:
+    print("Bytes per line item (instance + attribute storage):")
+    print(f"  plain dataclass     : {bytes_per_item(PlainCartItem):6.1f}")
+    print(f"  frozen + __slots__  : {bytes_per_item(CartItem):6.1f}")
+
+    cart = ShoppingCart()
+    for i in range(lines):
+        cart.add(Product(f"P{i}", 1.0 + i % 7, 10, "Misc"), quantity=1 + i % 3)
+
+    t0 = time.perf_counter()
+    for _ in range(reads):
+        old_items = list(cart.items)
+        old_subtotal = sum(i.line_total for i in old_items)
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(reads):
+        items = cart.items
+        subtotal = cart.subtotal
+    t_new = time.perf_counter() - t0
+
+    print(f"\n{reads:,} reads of items + subtotal on a {lines:,}-line cart:")
+    print(f"  re-sum + list copy  : {t_old * 1e3:9.2f} ms")
+    print(f"  incremental + view  : {t_new * 1e3:9.2f} ms")
+    print(f"  same subtotal: {abs(old_subtotal - subtotal) < 1e-6}, same lines: {len(items) == len(old_items)}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,354 @@
+"""
+📊 Columnar Inventory (struct-of-arrays)
+---------------------------------------
+`Inventory` in OOP3_Online_Shopping2.py keeps one `Product` object per SKU.
+That is easy to read, but every product costs a full dataclass instance and
+every catalog-wide question ("how much is our stock worth?") is a Python loop.
+
+`ColumnarInventory` offers the same API but stores each field in its own
+NumPy column:
+
+    names, sorted    (UTF-8 bytes, fixed width) + the row of each name (intp)
+    price[row]       (float64)
+    quantity[row]    (int64)
+    category[row]    (int32 code into a small list of category names)
+
+Whole-catalog queries then run as vectorized NumPy operations.
+
+Names are found by binary search (`searchsorted`) in the sorted name array
+instead of a name -> row dict: a dict entry, a str and a boxed int cost
+~150 bytes per SKU, more than all the other columns together. Products
+added one at a time wait in a small dict and are merged into the sorted
+arrays in batches.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from OOP3_Online_Shopping2 import Inventory, Product
+
+
+class ColumnarInventory:
+    """Array-backed product inventory with the same API as `Inventory`."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        capacity = max(int(capacity), 1)
+        # Sorted names and their rows; rows added since the last merge are in _recent
+        self._keys = np.zeros(0, dtype="S1")
+        self._order = np.zeros(0, dtype=np.intp)
+        self._recent: Dict[str, int] = {}
+        self._prices = np.zeros(capacity, dtype=np.float64)
+        self._quantities = np.zeros(capacity, dtype=np.int64)
+        self._category_codes = np.zeros(capacity, dtype=np.int32)
+        self._categories: List[str] = []
+        self._category_index: Dict[str, int] = {}
+        self._size = 0
+
+    # ---------------------------
+    # Same API as Inventory
+    # ---------------------------
+
+    def add_product(self, product: Product) -> None:
+        """Add or update a product (by name). Quantities are overwritten unless you call `increase_stock`."""
+        row = self._row_of(product.name)
+        if row is None:
+            self._encode(product.name)
+            self._reserve(self._size + 1)
+            row = self._size
+            self._recent[product.name] = row
+            self._size += 1
+            if len(self._recent) > max(256, len(self._order) // 32):
+                self._merge_recent()
+        self._prices[row] = product.price
+        self._quantities[row] = product.quantity
+        self._category_codes[row] = self._category_code(product.category)
+
+    def increase_stock(self, name: str, amount: int) -> None:
+        row = self._require(name)
+        if amount < 0:
+            raise ValueError("Increase amount must be non-negative.")
+        self._quantities[row] += amount
+
+    def decrease_stock(self, name: str, amount: int) -> None:
+        row = self._require(name)
+        if amount < 0:
+            raise ValueError("Decrease amount must be non-negative.")
+        if self._quantities[row] < amount:
+            raise ValueError(f"Insufficient stock for '{name}'.")
+        self._quantities[row] -= amount
+
+    def remove_product(self, name: str) -> None:
+        """Remove a product by moving the last row into its slot (O(n): the sorted arrays shift)."""
+        self._require(name)
+        self._merge_recent()
+        position = self._position(self._encode(name))
+        row, last = int(self._order[position]), self._size - 1
+        self._keys = np.delete(self._keys, position)
+        order = self._order = np.delete(self._order, position)
+        if row != last:
+            order[order == last] = row
+            self._prices[row] = self._prices[last]
+            self._quantities[row] = self._quantities[last]
+            self._category_codes[row] = self._category_codes[last]
+        self._size -= 1
+
+    def get(self, name: str) -> Product:
+        """
+        Build a `Product` for one row.
+        The returned object is a snapshot: mutating it does not change the inventory.
+        """
+        row = self._require(name)
+        return Product(
+            name=name,
+            price=float(self._prices[row]),
+            quantity=int(self._quantities[row]),
+            category=self._categories[self._category_codes[row]],
+        )
+
+    def has_stock(self, name: str, amount: int) -> bool:
+        row = self._row_of(name)
+        return row is not None and bool(self._quantities[row] >= amount)
+
+    # ---------------------------
+    # Bulk loading
+    # ---------------------------
+
+    def add_products_bulk(
+        self,
+        names: Sequence[str],
+        prices: Iterable[float],
+        quantities: Iterable[int],
+        categories: Sequence[str],
+    ) -> None:
+        """
+        Load many *new* products at once from parallel columns.
+        Much faster than calling `add_product` per row for multi-million SKU catalogs.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.int64)
+        n = len(names)
+        if not (len(prices) == len(quantities) == len(categories) == n):
+            raise ValueError("All columns must have the same length.")
+        if (prices < 0).any():
+            raise ValueError("Price cannot be negative.")
+        if (quantities < 0).any():
+            raise ValueError("Quantity cannot be negative.")
+
+        start = self._size
+        if "\0" in "".join(names):
+            raise ValueError("Product names cannot contain NUL characters.")
+        keys = np.array([name.encode() for name in names]) if n else np.zeros(0, dtype="S1")
+        self._merge_recent()
+        by_name = np.argsort(keys, kind="stable")
+        keys = keys[by_name]
+        if (keys[1:] == keys[:-1]).any() or (self._positions(keys) >= 0).any():
+            raise ValueError("Bulk load requires unique names that are not already in the inventory.")
+
+        # Map category strings to codes once per distinct category, not per row.
+        uniques, inverse = np.unique(np.asarray(categories, dtype=object), return_inverse=True)
+        codes = np.array([self._category_code(c) for c in uniques], dtype=np.int32)[inverse]
+
+        self._reserve(start + n)
+        self._prices[start:start + n] = prices
+        self._quantities[start:start + n] = quantities
+        self._category_codes[start:start + n] = codes
+        self._insert_sorted(keys, start + by_name)
+        self._size += n
+
+    # ---------------------------
+    # Vectorized catalog queries
+    # ---------------------------
+
+    def total_stock_value(self) -> float:
+        """Sum of price * quantity over the whole catalog."""
+        n = self._size
+        return float(np.dot(self._prices[:n], self._quantities[:n]))
+
+    def low_stock(self, threshold: int) -> List[str]:
+        """Names of products whose quantity is below `threshold`."""
+        rows = np.flatnonzero(self._quantities[:self._size] < threshold)
+        self._merge_recent()
+        names = np.empty(self._size, dtype=self._keys.dtype)
+        names[self._order] = self._keys                 # row -> name
+        return [name.decode() for name in names[rows].tolist()]
+
+    def category_totals(self) -> Dict[str, float]:
+        """Stock value per category."""
+        n = self._size
+        values = self._prices[:n] * self._quantities[:n]
+        sums = np.bincount(self._category_codes[:n], weights=values, minlength=len(self._categories))
+        return {cat: float(total) for cat, total in zip(self._categories, sums)}
+
+    def category_quantities(self) -> Dict[str, int]:
+        """Units in stock per category."""
+        n = self._size
+        sums = np.bincount(
+            self._category_codes[:n], weights=self._quantities[:n], minlength=len(self._categories)
+        )
+        return {cat: int(total) for cat, total in zip(self._categories, sums)}
+
+    def nbytes(self) -> int:
+        """Approximate bytes used by the columns and the sorted names (not `_recent`)."""
+        return (self._keys.nbytes + self._order.nbytes + self._prices.nbytes
+                + self._quantities.nbytes + self._category_codes.nbytes)
+
+    # ---------------------------
+    # Internals
+    # ---------------------------
+
+    @staticmethod
+    def _encode(name: str) -> bytes:
+        if "\0" in name:
+            raise ValueError("Product names cannot contain NUL characters.")   # NumPy strips them
+        return name.encode()
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """Position of each key in `_keys`, or -1 where it is not there."""
+        positions = self._keys.searchsorted(keys)
+        found = positions < len(self._keys)
+        found[found] = self._keys[positions[found]] == keys[found]
+        return np.where(found, positions, -1)
+
+    def _position(self, key: bytes) -> int:
+        i = int(self._keys.searchsorted(key))
+        return i if i < len(self._keys) and self._keys[i] == key else -1
+
+    def _row_of(self, name: object) -> Optional[int]:
+        row = self._recent.get(name)
+        if row is not None or not isinstance(name, str) or "\0" in name:
+            return row
+        position = self._position(name.encode())
+        return None if position < 0 else int(self._order[position])
+
+    def _insert_sorted(self, keys: np.ndarray, rows: np.ndarray) -> None:
+        """Merge sorted new `keys` (and their rows) into the sorted arrays: O(n + k)."""
+        if keys.dtype.itemsize > self._keys.dtype.itemsize:
+            self._keys = self._keys.astype(keys.dtype)       # widen first: insert would truncate
+        at = self._keys.searchsorted(keys)
+        self._keys = np.insert(self._keys, at, keys)
+        self._order = np.insert(self._order, at, rows)
+
+    def _merge_recent(self) -> None:
+        """Move the names in `_recent` into the sorted arrays: O(n + k log k)."""
+        if not self._recent:
+            return
+        keys = np.array([name.encode() for name in self._recent])
+        rows = np.fromiter(self._recent.values(), dtype=np.intp, count=len(self._recent))
+        by_name = np.argsort(keys, kind="stable")
+        self._insert_sorted(keys[by_name], rows[by_name])
+        self._recent.clear()
+
+    def _require(self, name: str) -> int:
+        row = self._row_of(name)
+        if row is None:
+            raise KeyError(f"Product '{name}' not found in inventory.")
+        return row
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_index.get(category)
+        if code is None:
+            code = len(self._categories)
+            self._categories.append(category)
+            self._category_index[category] = code
+        return code
+
+    def _reserve(self, needed: int) -> None:
+        """Grow the columns geometrically so appends stay amortized O(1)."""
+        capacity = len(self._prices)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for attr in ("_prices", "_quantities", "_category_codes"):
+            old = getattr(self, attr)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, attr, new)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, name: object) -> bool:
+        return self._row_of(name) is not None
+
+    def __repr__(self) -> str:
+        return f"ColumnarInventory(products={self._size}, categories={len(self._categories)})"
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(n: int = 1_000_000) -> None:
+    """Compare memory and query time of `Inventory` vs `ColumnarInventory` for `n` SKUs."""
+    import time
+    import tracemalloc
+
+    names = [f"SKU-{i:08d}" for i in range(n)]
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(0.5, 500.0, n).round(2)
+    quantities = rng.integers(0, 200, n)
+    category_names = ["Drinks", "Frozen", "Snacks", "Bakery", "Dairy"]
+    categories = [category_names[i % len(category_names)] for i in range(n)]
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    classic = Inventory()
+    for name, price, qty, cat in zip(names, prices.tolist(), quantities.tolist(), categories):
+        classic.add_product(Product(name, price, qty, cat))
+    load_classic = time.perf_counter() - t0
+    mem_classic = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    columnar = ColumnarInventory(capacity=n)
+    columnar.add_products_bulk(names, prices, quantities, categories)
+    load_columnar = time.perf_counter() - t0
+    mem_columnar = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    value_classic = sum(p.price * p.quantity for p in classic._products.values())
+    query_classic = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    value_columnar = columnar.total_stock_value()
+    query_columnar = time.perf_counter() - t0
+
+    # The price of the compact index: a single lookup is a binary search, not a hash
+    sample = names[::max(n // 10_000, 1)]
+    t0 = time.perf_counter()
+    for name in sample:
+        classic.has_stock(name, 1)
+    lookup_classic = (time.perf_counter() - t0) / len(sample)
+    t0 = time.perf_counter()
+    for name in sample:
+        columnar.has_stock(name, 1)
+    lookup_columnar = (time.perf_counter() - t0) / len(sample)
+
+    print(f"SKUs: {n:,}")
+    print(f"  Inventory         : load {load_classic:6.2f}s  mem {mem_classic / 2**20:8.1f} MiB  "
+          f"stock value {query_classic * 1e3:8.2f} ms  lookup {lookup_classic * 1e6:5.2f} us")
+    print(f"  ColumnarInventory : load {load_columnar:6.2f}s  mem {mem_columnar / 2**20:8.1f} MiB  "
+          f"stock value {query_columnar * 1e3:8.2f} ms  lookup {lookup_columnar * 1e6:5.2f} us")
+    print(f"  values match: {abs(value_classic - value_columnar) < 1e-6 * max(value_classic, 1)}")
+
+
+if __name__ == "__main__":
+    inventory = ColumnarInventory()
+    inventory.add_product(Product(name="Water", price=1.00, quantity=20, category="Drinks"))
+    inventory.add_product(Product(name="Ice", price=2.50, quantity=5, category="Frozen"))
+    inventory.add_product(Product(name="Chocolate", price=3.75, quantity=40, category="Snacks"))
+
+    inventory.decrease_stock("Chocolate", 30)
+    print("📦", inventory)
+    print("  Chocolate       :", inventory.get("Chocolate"))
+    print("  Stock value     :", inventory.total_stock_value())       # 20*1 + 5*2.5 + 10*3.75 = 70.0
+    print("  Low stock (<10) :", inventory.low_stock(10))             # ['Ice']
+    print("  Per category    :", inventory.category_totals())
+
+    print("\n⏱️  Benchmark")
+    benchmark(200_000)
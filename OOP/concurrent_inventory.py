@@ -0,0 +1,230 @@
+"""
+🔒 Thread-safe Inventory with striped locks
+------------------------------------------
+`User.place_order` first checks every line with `has_stock` and then calls
+`decrease_stock` for every line. With two threads sharing one `Inventory`,
+both can pass the check before either decreases the stock.
+
+One global lock fixes that but serializes every checkout. Instead,
+`ConcurrentInventory` hashes each product name onto one of N lock "stripes":
+
+- carts that touch different stripes never wait for each other
+- a cart acquires all its stripes in ascending stripe order, so two carts
+  can never hold locks in opposite orders → no deadlocks
+- `reserve_batch` (used by `place_orders_bulk` and the async checkout)
+  holds the stripes of every product in the batch the same way
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence
+
+from OOP3_Online_Shopping2 import Inventory, Order, PaymentProcessor, Product, User, place_orders_bulk
+
+
+class ConcurrentInventory(Inventory):
+    """`Inventory` that can be shared by many checkout threads."""
+
+    def __init__(self, stripes: int = 64) -> None:
+        super().__init__()
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, name: str) -> int:
+        return hash(name) % len(self._locks)
+
+    @contextmanager
+    def _locked(self, names: Iterable[str]) -> Iterator[None]:
+        """Hold the stripes of all `names`, acquired in ascending order."""
+        stripes = sorted({self._stripe(name) for name in names})
+        for s in stripes:
+            self._locks[s].acquire()
+        try:
+            yield
+        finally:
+            for s in reversed(stripes):
+                self._locks[s].release()
+
+    # ---------------------------
+    # Single-product operations
+    # ---------------------------
+
+    def add_product(self, product: Product) -> None:
+        with self._locks[self._stripe(product.name)]:
+            super().add_product(product)
+
+    def increase_stock(self, name: str, amount: int) -> None:
+        with self._locks[self._stripe(name)]:
+            super().increase_stock(name, amount)
+
+    def decrease_stock(self, name: str, amount: int) -> None:
+        with self._locks[self._stripe(name)]:
+            super().decrease_stock(name, amount)
+
+    def remove_product(self, name: str) -> None:
+        with self._locks[self._stripe(name)]:
+            super().remove_product(name)
+
+    # ---------------------------
+    # Multi-product reservation
+    # ---------------------------
+
+    def reserve(self, cart: Mapping[str, int]) -> bool:
+        """
+        Atomically reserve every line of `cart` ({product name: amount}).
+        Either all lines are decreased or nothing changes.
+        """
+        if any(amount < 0 for amount in cart.values()):
+            raise ValueError("Reserve amount must be non-negative.")
+        with self._locked(cart):
+            products = self._products
+            for name, amount in cart.items():
+                p = products.get(name)
+                if p is None or p.quantity < amount:
+                    return False
+            for name, amount in cart.items():
+                products[name].quantity -= amount
+            return True
+
+    def reserve_batch(self, carts: Sequence[Mapping[str, int]]) -> List[bool]:
+        """`Inventory.reserve_batch`, holding the stripes of every product in the batch."""
+        with self._locked(name for cart in carts for name in cart):
+            return super().reserve_batch(carts)
+
+    def release(self, cart: Mapping[str, int]) -> None:
+        """Give back stock taken by `reserve` (e.g. after a failed payment)."""
+        for name, amount in cart.items():
+            self.increase_stock(name, amount)
+
+
+def place_order(user: User, inventory: ConcurrentInventory, payment: PaymentProcessor) -> Order:
+    """Race-free version of `User.place_order` for a shared `ConcurrentInventory`."""
+    cart = {i.product_name: i.quantity for i in user.cart.items}
+    if not cart:
+        raise ValueError("Cart is empty.")
+    if not inventory.reserve(cart):
+        raise ValueError("Insufficient stock.")
+    try:
+        return user._checkout(payment)
+    except RuntimeError:
+        inventory.release(cart)
+        raise
+
+
+# ---------------------------
+# Stress test / throughput
+# ---------------------------
+
+def stress_test(threads: int = 8, orders_per_thread: int = 5_000, products: int = 100, seed: int = 0) -> float:
+    """
+    Hammer one shared inventory from many threads and check the invariants:
+    - no product ever ends with negative stock
+    - initial stock == final stock + units sold (nothing lost or duplicated)
+    Returns throughput in order attempts per second.
+    """
+    inventory = ConcurrentInventory()
+    initial: Dict[str, int] = {}
+    for i in range(products):
+        name = f"P{i}"
+        initial[name] = 2_000
+        inventory.add_product(Product(name, 1.0 + i % 10, initial[name], "Misc"))
+
+    payment = PaymentProcessor()
+    sold: List[Dict[str, int]] = [{} for _ in range(threads)]
+    start = threading.Barrier(threads)
+
+    def worker(k: int) -> None:
+        rng = random.Random(seed + k)
+        user = User(f"worker{k}", f"worker{k}@shop.com", "Warehouse 1")
+        start.wait()
+        for _ in range(orders_per_thread):
+            for _ in range(rng.randint(1, 5)):
+                user.cart.add(inventory.get(f"P{rng.randrange(products)}"), rng.randint(1, 3))
+            cart = {i.product_name: i.quantity for i in user.cart.items}
+            try:
+                place_order(user, inventory, payment)
+            except ValueError:
+                user.cart.clear()
+                continue
+            for name, amount in cart.items():
+                sold[k][name] = sold[k].get(name, 0) + amount
+
+    workers = [threading.Thread(target=worker, args=(k,)) for k in range(threads)]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - t0
+
+    for name, qty in initial.items():
+        final = inventory.get(name).quantity
+        units_sold = sum(s.get(name, 0) for s in sold)
+        assert final >= 0, f"Negative stock for {name}: {final}"
+        assert qty == final + units_sold, f"Stock not conserved for {name}"
+    return threads * orders_per_thread / elapsed
+
+
+def stress_test_batches(threads: int = 8, batches_per_thread: int = 500, batch_size: int = 10,
+                        products: int = 20, seed: int = 0) -> None:
+    """
+    Like `stress_test`, but half the threads check out whole batches with
+    `place_orders_bulk` (one `reserve_batch` each) while the other half place
+    single orders, all on the same few products. Stock must be conserved.
+    """
+    inventory = ConcurrentInventory(stripes=8)
+    initial = {f"P{i}": 5_000 for i in range(products)}
+    for name, qty in initial.items():
+        inventory.add_product(Product(name, 1.0, qty, "Misc"))
+
+    payment = PaymentProcessor()
+    sold: List[Dict[str, int]] = [{} for _ in range(threads)]
+    start = threading.Barrier(threads)
+
+    def worker(k: int) -> None:
+        rng = random.Random(seed + k)
+        users = [User(f"w{k}u{u}", f"w{k}u{u}@shop.com", "Warehouse 1") for u in range(batch_size)]
+        start.wait()
+        for _ in range(batches_per_thread):
+            for user in users:
+                for _ in range(rng.randint(1, 3)):
+                    user.cart.add(inventory.get(f"P{rng.randrange(products)}"), rng.randint(1, 3))
+            if k % 2:
+                orders = []
+                for user in users:
+                    try:
+                        orders.append(place_order(user, inventory, payment))
+                    except ValueError:
+                        pass
+            else:
+                orders = [o for o in place_orders_bulk(users, inventory, payment) if o is not None]
+            for order in orders:
+                for item in order.items:
+                    sold[k][item.product_name] = sold[k].get(item.product_name, 0) + item.quantity
+            for user in users:
+                user.cart.clear()
+
+    workers = [threading.Thread(target=worker, args=(k,)) for k in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    for name, qty in initial.items():
+        final = inventory.get(name).quantity
+        assert final >= 0, f"Negative stock for {name}: {final}"
+        assert qty == final + sum(s.get(name, 0) for s in sold), f"Stock not conserved for {name}"
+
+
+if __name__ == "__main__":
+    print("🔒 Concurrent checkout stress test (invariants are asserted)")
+    for n in (1, 2, 4, 8, 16):
+        rate = stress_test(threads=n, orders_per_thread=20_000 // n)
+        print(f"  threads={n:2d}: {rate:10,.0f} orders/s")
+    stress_test_batches()
+    print("  reserve_batch (place_orders_bulk) alongside single orders: stock conserved")
+    # Note: on a GIL build these numbers stay roughly flat; striped locks only
+    # add parallelism on free-threaded Python or when checkout releases the GIL (I/O).
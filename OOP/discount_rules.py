@@ -0,0 +1,296 @@
+"""
+🏷️ Declarative discount rules, compiled once
+-------------------------------------------
+`discount_engine(subtotal)` in OOP3_Online_Shopping2.py hard-codes one rule
+(10% off from 100). Real shops run thousands of promotions at once:
+
+- TierRule       : x% off the whole order from a subtotal threshold
+- CategoryRule   : x% off every line in a category
+- BuyNGetMRule   : buy N of a product, get M of them free
+- CouponRule     : x% off (optionally from a minimum subtotal) with a code
+
+Checking every rule against every cart line would be O(lines * rules).
+`DiscountRuleSet.compile()` instead builds lookup tables once:
+
+- category -> best percent            (dict)
+- product  -> its (buy, free) deals   (dict; deals that never give more
+                                         than another one are dropped)
+- sorted tier thresholds + running max (binary search with `bisect`)
+- coupon code -> rule                  (dict)
+
+so evaluating a cart costs O(lines + log tiers).
+
+How discounts combine:
+1. per line, the best of its category discount and its buy-N-get-M deals
+2. the best tier reached by the subtotal (after line discounts)
+3. a coupon, on what is left after steps 1 and 2
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from OOP3_Online_Shopping2 import CartItem, discount_engine
+
+
+# ---------------------------
+# Rule definitions
+# ---------------------------
+
+@dataclass(frozen=True)
+class TierRule:
+    threshold: float
+    percent: float
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    category: str
+    percent: float
+
+
+@dataclass(frozen=True)
+class BuyNGetMRule:
+    product_name: str
+    buy: int
+    free: int
+
+
+@dataclass(frozen=True)
+class CouponRule:
+    code: str
+    percent: float
+    min_subtotal: float = 0.0
+
+
+Rule = Union[TierRule, CategoryRule, BuyNGetMRule, CouponRule]
+
+
+def _check_percent(percent: float) -> None:
+    if not 0.0 <= percent <= 1.0:
+        raise ValueError("Percent must be between 0 and 1.")
+
+
+class DiscountRuleSet:
+    """A collection of rules that can be compiled into a fast evaluator."""
+
+    def __init__(self, rules: Iterable[Rule] = ()) -> None:
+        self.rules: List[Rule] = []
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule: Rule) -> None:
+        if isinstance(rule, (TierRule, CategoryRule, CouponRule)):
+            _check_percent(rule.percent)
+        elif isinstance(rule, BuyNGetMRule):
+            if rule.buy <= 0 or rule.free <= 0:
+                raise ValueError("Buy and free counts must be positive.")
+        else:
+            raise TypeError(f"Unknown rule type: {type(rule).__name__}")
+        self.rules.append(rule)
+
+    def compile(self) -> CompiledDiscounts:
+        category_pct: Dict[str, float] = {}
+        deals: Dict[str, List[Tuple[int, int]]] = {}
+        tiers: Dict[float, float] = {}
+        coupons: Dict[str, CouponRule] = {}
+
+        for rule in self.rules:
+            if isinstance(rule, TierRule):
+                tiers[rule.threshold] = max(rule.percent, tiers.get(rule.threshold, 0.0))
+            elif isinstance(rule, CategoryRule):
+                category_pct[rule.category] = max(rule.percent, category_pct.get(rule.category, 0.0))
+            elif isinstance(rule, BuyNGetMRule):
+                deals.setdefault(rule.product_name, []).append((rule.buy, rule.free))
+            else:
+                coupons[rule.code] = rule
+
+        # Which deal is best depends on the quantity (buy 2 get 1 beats buy 5 get 3
+        # at 3 units, not at 8), so all are kept except those another deal beats
+        # at every quantity: a group no larger with at least as many free units
+        compiled_deals = {name: tuple(d for d in set(options) if not any(
+                              e != d and e[0] + e[1] <= d[0] + d[1] and e[1] >= d[1] for e in options))
+                          for name, options in deals.items()}
+
+        thresholds = sorted(tiers)
+        # best_pct[i] = best percent for any threshold <= thresholds[i]
+        best_pct = list(accumulate((tiers[t] for t in thresholds), max))
+        return CompiledDiscounts(category_pct, compiled_deals, thresholds, best_pct, coupons)
+
+
+class CompiledDiscounts:
+    """Read-only lookup tables built by `DiscountRuleSet.compile()`."""
+
+    def __init__(self, category_pct: Dict[str, float], deals: Dict[str, Tuple[Tuple[int, int], ...]],
+                 thresholds: List[float], best_pct: List[float], coupons: Dict[str, CouponRule]) -> None:
+        self._category_pct = category_pct
+        self._deals = deals
+        self._thresholds = thresholds
+        self._best_pct = best_pct
+        self._coupons = coupons
+
+    def tier_percent(self, subtotal: float) -> float:
+        i = bisect_right(self._thresholds, subtotal)
+        return self._best_pct[i - 1] if i else 0.0
+
+    def line_discount(self, item: CartItem, category: Optional[str]) -> float:
+        """Best of the category discount and the buy-N-get-M deals for one line."""
+        best = item.line_total * self._category_pct.get(category, 0.0)
+        for buy, free in self._deals.get(item.product_name, ()):
+            free_units = (item.quantity // (buy + free)) * free
+            best = max(best, free_units * item.unit_price)
+        return best
+
+    def evaluate(self, items: Iterable[CartItem], categories: Mapping[str, str],
+                 coupon: Optional[str] = None) -> float:
+        """
+        Total discount for the cart lines.
+        `categories` maps product name -> category (e.g. from the inventory).
+        """
+        subtotal = 0.0
+        line_discounts = 0.0
+        category_pct = self._category_pct
+        deals = self._deals
+        for item in items:
+            subtotal += item.line_total
+            category = categories.get(item.product_name)
+            if category in category_pct or item.product_name in deals:
+                line_discounts += self.line_discount(item, category)
+
+        remaining = subtotal - line_discounts
+        tier_discount = remaining * self.tier_percent(remaining)
+        remaining -= tier_discount
+
+        coupon_discount = 0.0
+        rule = self._coupons.get(coupon) if coupon else None
+        if rule is not None and subtotal >= rule.min_subtotal:
+            coupon_discount = remaining * rule.percent
+        return line_discounts + tier_discount + coupon_discount
+
+
+# The hard-coded rule from OOP3_Online_Shopping2.py, written as data
+DEFAULT_RULES = DiscountRuleSet([TierRule(threshold=100.0, percent=0.10)])
+
+
+# ---------------------------
+# Checks
+# ---------------------------
+
+def _evaluate_rules(rules: Iterable[Rule], items: Iterable[CartItem], categories: Mapping[str, str],
+                    coupon: Optional[str] = None) -> float:
+    """`CompiledDiscounts.evaluate`, the slow way: every rule against every line."""
+    rules = list(rules)
+    subtotal = line_discounts = 0.0
+    for item in items:
+        subtotal += item.line_total
+        best = 0.0
+        for rule in rules:
+            if isinstance(rule, CategoryRule) and rule.category == categories.get(item.product_name):
+                best = max(best, item.line_total * rule.percent)
+            elif isinstance(rule, BuyNGetMRule) and rule.product_name == item.product_name:
+                best = max(best, item.quantity // (rule.buy + rule.free) * rule.free * item.unit_price)
+        line_discounts += best
+    remaining = subtotal - line_discounts
+    tier = max((r.percent for r in rules if isinstance(r, TierRule) and r.threshold <= remaining), default=0.0)
+    tier_discount = remaining * tier
+    remaining -= tier_discount
+    matches = [r for r in rules if isinstance(r, CouponRule) and coupon and r.code == coupon]
+    coupon_discount = remaining * matches[-1].percent if matches and subtotal >= matches[-1].min_subtotal else 0.0
+    return line_discounts + tier_discount + coupon_discount
+
+
+def check_compiled(carts: int = 2_000, seed: int = 0) -> None:
+    """The compiled evaluator against rule-by-rule evaluation, including competing buy-N-get-M deals."""
+    import random
+
+    # At 3 units buy 2 get 1 wins (1 free, 0 from the other); at 8, buy 5 get 3 (3 free vs 2)
+    rules = DiscountRuleSet([BuyNGetMRule("Water", 2, 1), BuyNGetMRule("Water", 5, 3)])
+    for quantity, free in ((3, 1), (8, 3)):
+        cart = [CartItem("Water", 1.0, quantity)]
+        assert rules.compile().evaluate(cart, {}) == _evaluate_rules(rules.rules, cart, {}) == free, quantity
+
+    rng = random.Random(seed)
+    for _ in range(carts):
+        rules = DiscountRuleSet()
+        for _ in range(rng.randint(1, 12)):
+            kind = rng.randrange(4)
+            if kind == 0:
+                rules.add(TierRule(rng.uniform(0, 300), rng.uniform(0, 0.3)))
+            elif kind == 1:
+                rules.add(CategoryRule(f"C{rng.randrange(3)}", rng.uniform(0, 0.5)))
+            elif kind == 2:
+                rules.add(BuyNGetMRule(f"P{rng.randrange(4)}", rng.randint(1, 6), rng.randint(1, 4)))
+            else:
+                rules.add(CouponRule(f"CODE{rng.randrange(2)}", rng.uniform(0, 0.3), rng.uniform(0, 200)))
+        items = [CartItem(f"P{p}", rng.uniform(1, 20), rng.randint(1, 15)) for p in rng.sample(range(6), 3)]
+        categories = {f"P{p}": f"C{p % 4}" for p in range(6)}
+        coupon = rng.choice([None, "CODE0", "CODE1"])
+        expected = _evaluate_rules(rules.rules, items, categories, coupon)
+        assert abs(rules.compile().evaluate(items, categories, coupon) - expected) < 1e-9, rules.rules
+    print(f"CompiledDiscounts: {carts:,} random rule sets match rule-by-rule evaluation")
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(lines: int = 500, promotions: int = 10_000, repeats: int = 200) -> None:
+    import random
+    import time
+
+    rng = random.Random(0)
+    n_products, n_categories = 50_000, 2_000
+    rules = DiscountRuleSet()
+    for i in range(promotions):
+        kind = i % 4
+        if kind == 0:
+            rules.add(TierRule(rng.uniform(10, 10_000), rng.uniform(0.01, 0.2)))
+        elif kind == 1:
+            rules.add(CategoryRule(f"C{rng.randrange(n_categories)}", rng.uniform(0.01, 0.5)))
+        elif kind == 2:
+            rules.add(BuyNGetMRule(f"P{rng.randrange(n_products)}", rng.randint(1, 4), rng.randint(1, 2)))
+        else:
+            rules.add(CouponRule(f"CODE{i}", rng.uniform(0.01, 0.3), rng.uniform(0, 200)))
+
+    t0 = time.perf_counter()
+    compiled = rules.compile()
+    t_compile = time.perf_counter() - t0
+
+    picks = rng.sample(range(n_products), lines)
+    items = [CartItem(f"P{p}", round(rng.uniform(1, 100), 2), rng.randint(1, 10)) for p in picks]
+    categories = {f"P{p}": f"C{p % n_categories}" for p in picks}
+
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        compiled.evaluate(items, categories, coupon="CODE3")
+    t_eval = (time.perf_counter() - t0) / repeats
+
+    print(f"{promotions:,} promotions, {lines}-line cart")
+    print(f"  compile : {t_compile * 1e3:7.2f} ms (once)")
+    print(f"  evaluate: {t_eval * 1e3:7.3f} ms per cart")
+
+
+if __name__ == "__main__":
+    default = DEFAULT_RULES.compile()
+    cart = [CartItem("Water", 1.00, 10), CartItem("Chocolate", 3.75, 30)]
+    print("Default rules match discount_engine:",
+          round(default.evaluate(cart, {}), 2) == round(discount_engine(122.5), 2))   # 12.25
+
+    rules = DiscountRuleSet([
+        TierRule(100.0, 0.05),
+        CategoryRule("Snacks", 0.20),
+        BuyNGetMRule("Water", buy=2, free=1),
+        CouponRule("WELCOME10", 0.10, min_subtotal=50.0),
+    ])
+    compiled = rules.compile()
+    categories = {"Water": "Drinks", "Chocolate": "Snacks"}
+    # Water: 3 free of 10 -> 3.00; Chocolate: 20% of 112.50 -> 22.50
+    # remaining 97.00 < 100 -> no tier; coupon 10% of 97.00 -> 9.70
+    print("Discount with coupon:", round(compiled.evaluate(cart, categories, coupon="WELCOME10"), 2))  # 35.2
+    check_compiled()
+
+    print("\n⏱️  Benchmark")
+    benchmark()
@@ -0,0 +1,216 @@
+"""
+🗂️ Central order store with secondary indexes
+---------------------------------------------
+Orders used to be reachable only through each `User.orders` list, so
+"find order 123" or "all SHIPPED orders" meant scanning every user.
+
+`OrderStore` keeps every order once and indexes it:
+
+    order id  -> Order                  (dict, O(1) lookup)
+    status    -> {order id: Order}      (dict per status, O(1) add/remove)
+    user      -> [order id, ...]        (dict of lists)
+    created_at, order id                (two parallel sorted arrays, range
+                                         queries with `bisect`)
+
+`Order.set_status` calls back into the store, so the status index is
+updated in place. Ids come from `next_order_id()` and are unique across
+users and increasing, so orders usually arrive already sorted by time and
+appending keeps the time index sorted. Orders that arrive out of time
+order (clock skew, loading old data) wait in an unsorted buffer that
+is sorted and merged in once, on the next time query, instead of being
+inserted one by one (O(n) each, quadratic for a whole load).
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional
+
+from OOP3_Online_Shopping2 import Order, OrderStatus
+
+
+class OrderStore:
+    """All orders, with lookup by id, status, user and creation time."""
+
+    def __init__(self) -> None:
+        self._by_id: Dict[int, Order] = {}
+        self._by_status: Dict[OrderStatus, Dict[int, Order]] = {s: {} for s in OrderStatus}
+        self._by_user: Dict[str, List[int]] = {}
+        # Compact typed arrays: 8 bytes per entry instead of a Python object each
+        self._times = array("d")
+        self._time_ids = array("q")
+        # Out-of-order arrivals, merged into the two arrays above by `_merge_pending`
+        self._pending_times = array("d")
+        self._pending_ids = array("q")
+
+    def add(self, user_email: str, order: Order) -> None:
+        if order.order_id in self._by_id:
+            raise ValueError(f"Order #{order.order_id} already stored.")
+        if order.store is not None and order.store is not self:
+            raise ValueError(f"Order #{order.order_id} belongs to another store.")
+        order._store = self
+        self._by_id[order.order_id] = order
+        self._by_status[order.status][order.order_id] = order
+        self._by_user.setdefault(user_email, []).append(order.order_id)
+
+        if not self._times or order.created_at >= self._times[-1]:
+            self._times.append(order.created_at)
+            self._time_ids.append(order.order_id)
+        else:
+            self._pending_times.append(order.created_at)
+            self._pending_ids.append(order.order_id)
+
+    def _merge_pending(self) -> None:
+        """Sort the out-of-order buffer into the time index: O(n + k log k) once per batch."""
+        if not self._pending_times:
+            return
+        times = self._times + self._pending_times
+        ids = self._time_ids + self._pending_ids
+        # Stable, and Timsort merges the already sorted prefix as one run
+        order = sorted(range(len(times)), key=times.__getitem__)
+        self._times = array("d", [times[i] for i in order])
+        self._time_ids = array("q", [ids[i] for i in order])
+        self._pending_times = array("d")
+        self._pending_ids = array("q")
+
+    def get(self, order_id: int) -> Order:
+        order = self._by_id.get(order_id)
+        if order is None:
+            raise KeyError(f"Order #{order_id} not found.")
+        return order
+
+    def by_status(self, status: OrderStatus) -> List[Order]:
+        return list(self._by_status[status].values())
+
+    def count_by_status(self, status: OrderStatus) -> int:
+        return len(self._by_status[status])
+
+    def by_user(self, user_email: str) -> List[Order]:
+        return [self._by_id[i] for i in self._by_user.get(user_email, ())]
+
+    def created_between(self, start: float, end: float) -> Iterator[Order]:
+        """Orders with start <= created_at < end, oldest first."""
+        self._merge_pending()
+        lo = bisect_left(self._times, start)
+        hi = bisect_left(self._times, end)
+        by_id = self._by_id
+        return (by_id[i] for i in self._time_ids[lo:hi])
+
+    def find(self, status: Optional[OrderStatus] = None, start: Optional[float] = None,
+             end: Optional[float] = None) -> List[Order]:
+        """
+        Orders matching an optional status and creation-time window,
+        e.g. `find(OrderStatus.SHIPPED, start=midnight)`.
+        Scans whichever index is smaller: the status bucket or the time range.
+        """
+        if start is None and end is None:
+            return self.by_status(status) if status is not None else list(self._by_id.values())
+        self._merge_pending()
+        lo = bisect_left(self._times, start) if start is not None else 0
+        hi = bisect_left(self._times, end) if end is not None else len(self._times)
+        if status is None:
+            return [self._by_id[i] for i in self._time_ids[lo:hi]]
+
+        bucket = self._by_status[status]
+        if len(bucket) < hi - lo:
+            start = float("-inf") if start is None else start
+            end = float("inf") if end is None else end
+            return sorted((o for o in bucket.values() if start <= o.created_at < end),
+                          key=lambda o: (o.created_at, o.order_id))
+        return [bucket[i] for i in self._time_ids[lo:hi] if i in bucket]
+
+    def _status_changed(self, order: Order, old: OrderStatus) -> None:
+        """Called by `Order.set_status`."""
+        del self._by_status[old][order.order_id]
+        self._by_status[order.status][order.order_id] = order
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._by_id
+
+    def __repr__(self) -> str:
+        counts = {s.name: len(b) for s, b in self._by_status.items() if b}
+        return f"OrderStore(orders={len(self._by_id)}, by_status={counts})"
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(orders: int = 1_000_000, users: int = 100_000) -> None:
+    import random
+    import time
+
+    from OOP3_Online_Shopping2 import CartItem, next_order_id
+
+    rng = random.Random(0)
+    store = OrderStore()
+    line = [CartItem("Water", 1.0, 1)]
+    day = 86_400.0
+    t_start = 1_700_000_000.0
+
+    t0 = time.perf_counter()
+    for k in range(orders):
+        order = Order(next_order_id(), line, 1.0, 0.0, 1.0, OrderStatus.PAID,
+                      created_at=t_start + k * (30 * day / orders))
+        store.add(f"user{rng.randrange(users)}", order)
+    t_add = time.perf_counter() - t0
+
+    ids = list(store._by_id)
+    t0 = time.perf_counter()
+    for order_id in rng.sample(ids, len(ids) // 10):
+        store.get(order_id).set_status(OrderStatus.SHIPPED)
+    t_status = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    today = store.find(OrderStatus.SHIPPED, start=t_start + 29 * day)
+    t_query = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    scan = [o for o in ids if store._by_id[o].status is OrderStatus.SHIPPED
+            and store._by_id[o].created_at >= t_start + 29 * day]
+    t_scan = time.perf_counter() - t0
+
+    # Loading old data out of time order: buffered, then merged once by the first query
+    late = OrderStore()
+    t0 = time.perf_counter()
+    for k in range(orders // 10):
+        order = Order(next_order_id(), line, 1.0, 0.0, 1.0, OrderStatus.PAID,
+                      created_at=t_start + rng.random() * 30 * day)
+        late.add(f"user{rng.randrange(users)}", order)
+    first = next(late.created_between(t_start, t_start + 30 * day))
+    t_late = time.perf_counter() - t0
+
+    print(f"{orders:,} orders, {users:,} users")
+    print(f"  add               : {t_add:6.2f}s")
+    print(f"  {len(ids) // 10:,} set_status : {t_status:6.2f}s")
+    print(f"  SHIPPED today     : {t_query * 1e3:8.2f} ms ({len(today):,} orders)")
+    print(f"  full scan         : {t_scan * 1e3:8.2f} ms (same: {len(scan) == len(today)})")
+    print(f"  {orders // 10:,} unordered adds + first query: {t_late:6.2f}s "
+          f"(oldest first: {first.created_at == min(late._times)})")
+
+
+if __name__ == "__main__":
+    from OOP3_Online_Shopping2 import Inventory, PaymentProcessor, Product, User
+
+    inventory = Inventory()
+    inventory.add_product(Product("Water", 1.00, 100, "Drinks"))
+    store = OrderStore()
+    payment = PaymentProcessor()
+    for name in ("Sina", "Ali"):
+        user = User(name, f"{name.lower()}@g.com", "Wels")
+        for _ in range(2):
+            user.cart.add(inventory.get("Water"), 3)
+            store.add(user.email, user.place_order(inventory, payment))
+
+    store.get(2).set_status(OrderStatus.SHIPPED)
+    print("🗂️ ", store)
+    print("  Order ids     :", sorted(store._by_id))                       # [1, 2, 3, 4]: no collisions
+    print("  Ali's orders  :", [o.order_id for o in store.by_user("ali@g.com")])
+    print("  Shipped       :", [o.order_id for o in store.by_status(OrderStatus.SHIPPED)])
+
+    print("\n⏱️  Benchmark")
+    benchmark()
@@ -0,0 +1,528 @@
+"""
+💾 Write-ahead log + snapshots for Inventory and orders
+------------------------------------------------------
+Everything in OOP3_Online_Shopping2.py lives in memory, so a restart loses
+all stock levels and orders. Pickling the whole object graph after every
+change would be far too slow.
+
+The usual database approach:
+
+1. Write-ahead log (WAL): every mutation is appended to a log file as a
+   small binary record. Records are buffered and written + fsync-ed in
+   groups ("group commit"), so thousands of mutations share one fsync.
+2. Snapshots: from time to time (every `snapshot_every` log records) the
+   full state is written to a compact binary file and a fresh, empty log
+   is started, so the log - and recovery time - stays bounded.
+3. Recovery: load the newest snapshot, then replay only the log written
+   after it.
+
+Both files start with an 8-byte magic that names the format version
+(`SHOPWAL2`, `SHOPSNP2`: order records carry `created_at`); files of another
+version are rejected instead of being decoded with the wrong layout. Then
+records follow, little endian:
+
+    uint32 payload length | uint8 type | payload | uint32 crc32(type + payload)
+
+A torn record at the end of the log (crash mid-write) fails its length or
+CRC check and is ignored, along with anything after it.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from OOP3_Online_Shopping2 import CartItem, Inventory, Order, OrderStatus, Product, advance_order_ids
+
+
+# ---------------------------
+# Binary record encoding
+# ---------------------------
+
+STOCK_SET, STOCK_DELTA, PRODUCT_REMOVE, ORDER_PLACED, ORDER_STATUS = range(1, 6)
+
+_HEADER = struct.Struct("<IB")
+_CRC = struct.Struct("<I")
+_STR_LEN = struct.Struct("<H")
+_PRICE_QTY = struct.Struct("<dq")
+_DELTA = struct.Struct("<q")
+_ORDER = struct.Struct("<qddddBI")
+_STATUS = struct.Struct("<qB")
+
+
+def _frame(kind: int, payload: bytes) -> bytes:
+    body = bytes((kind,)) + payload
+    return _HEADER.pack(len(payload), kind) + payload + _CRC.pack(zlib.crc32(body))
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return _STR_LEN.pack(len(raw)) + raw
+
+
+def _unpack_str(buf: bytes, pos: int) -> Tuple[str, int]:
+    (n,) = _STR_LEN.unpack_from(buf, pos)
+    pos += _STR_LEN.size
+    return buf[pos:pos + n].decode("utf-8"), pos + n
+
+
+def encode_product(product: Product) -> bytes:
+    return _frame(STOCK_SET, _pack_str(product.name) + _pack_str(product.category)
+                  + _PRICE_QTY.pack(product.price, product.quantity))
+
+
+def encode_delta(name: str, delta: int) -> bytes:
+    return _frame(STOCK_DELTA, _pack_str(name) + _DELTA.pack(delta))
+
+
+def encode_remove(name: str) -> bytes:
+    return _frame(PRODUCT_REMOVE, _pack_str(name))
+
+
+def encode_order(user_email: str, order: Order) -> bytes:
+    parts = [_pack_str(user_email),
+             _ORDER.pack(order.order_id, order.subtotal, order.discount, order.total,
+                         order.created_at, order.status.value, len(order.items))]
+    for item in order.items:
+        parts.append(_pack_str(item.product_name))
+        parts.append(_PRICE_QTY.pack(item.unit_price, item.quantity))
+    return _frame(ORDER_PLACED, b"".join(parts))
+
+
+def encode_status(user_email: str, order_id: int, status: OrderStatus) -> bytes:
+    return _frame(ORDER_STATUS, _pack_str(user_email) + _STATUS.pack(order_id, status.value))
+
+
+def read_records(f: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[Tuple[int, bytes, int]]:
+    """
+    Yield (type, payload, end offset) for every intact record; stop at the first torn one.
+    Offsets are relative to where `f` was positioned. The log is read `chunk_size`
+    bytes at a time, so memory does not grow with its length.
+    """
+    data, pos, base = b"", 0, 0        # base: offset of data[0]
+    while True:
+        need = _HEADER.size
+        if len(data) - pos >= need:
+            length, kind = _HEADER.unpack_from(data, pos)
+            need += length + _CRC.size
+        if len(data) - pos < need:
+            more = f.read(max(chunk_size, need - (len(data) - pos)))
+            if not more:
+                return                     # end of the log, possibly mid-record
+            base += pos
+            data, pos = data[pos:] + more, 0
+            continue
+        start = pos + _HEADER.size
+        stop = start + length
+        (crc,) = _CRC.unpack_from(data, stop)
+        if crc != zlib.crc32(data[start - 1:stop]):
+            return
+        pos = stop + _CRC.size
+        yield kind, data[start:stop], base + pos
+
+
+# ---------------------------
+# Write-ahead log
+# ---------------------------
+
+_WAL_MAGIC = b"SHOPWAL2"
+
+
+class WriteAheadLog:
+    """
+    Append-only log with buffered, group-committed writes.
+    `records` counts the records in the file (`records` already there when
+    it is opened); `on_flush` is called after every group is written.
+    """
+
+    def __init__(self, path: str, group_size: int = 4096, fsync: bool = True, records: int = 0,
+                 on_flush: Optional[Callable[[], None]] = None) -> None:
+        self.path = path
+        self.group_size = group_size
+        self.fsync = fsync
+        self.records = records
+        self.on_flush = on_flush
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_WAL_MAGIC)
+            self._file.flush()
+        self._buffer: List[bytes] = []
+
+    def append(self, record: bytes) -> None:
+        self._buffer.append(record)
+        if len(self._buffer) >= self.group_size:
+            self.flush()
+
+    def append_many(self, records: Iterable[bytes]) -> None:
+        """Append records that must end up in the same log (no flush between them)."""
+        self._buffer.extend(records)
+        if len(self._buffer) >= self.group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered records and (optionally) fsync once for the whole group."""
+        if not self._buffer:
+            return
+        self._file.write(b"".join(self._buffer))
+        self.records += len(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        if self.on_flush is not None:
+            self.on_flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> WriteAheadLog:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class LoggedInventory(Inventory):
+    """
+    `Inventory` that appends every stock mutation to a `WriteAheadLog`.
+    Without a log (`wal=None`) it behaves like a plain `Inventory`.
+    """
+
+    def __init__(self, wal: Optional[WriteAheadLog] = None) -> None:
+        super().__init__()
+        self.wal = wal
+
+    def add_product(self, product: Product) -> None:
+        super().add_product(product)
+        if self.wal is not None:
+            self.wal.append(encode_product(product))
+
+    def increase_stock(self, name: str, amount: int) -> None:
+        super().increase_stock(name, amount)
+        if self.wal is not None:
+            self.wal.append(encode_delta(name, amount))
+
+    def decrease_stock(self, name: str, amount: int) -> None:
+        super().decrease_stock(name, amount)
+        if self.wal is not None:
+            self.wal.append(encode_delta(name, -amount))
+
+    def remove_product(self, name: str) -> None:
+        super().remove_product(name)
+        if self.wal is not None:
+            self.wal.append(encode_remove(name))
+
+    def reserve_batch(self, carts: Sequence[Mapping[str, int]]) -> List[bool]:
+        results = super().reserve_batch(carts)
+        if self.wal is None:
+            return results
+        # One delta per product for the whole batch
+        deltas: Dict[str, int] = {}
+        for cart, ok in zip(carts, results):
+            if ok:
+                for name, amount in cart.items():
+                    deltas[name] = deltas.get(name, 0) - amount
+        # In one go: a snapshot between them would hold the whole batch, and replay
+        # the deltas still in the new log a second time
+        self.wal.append_many(encode_delta(name, delta) for name, delta in deltas.items() if delta)
+        return results
+
+
+# ---------------------------
+# Store: snapshots + recovery
+# ---------------------------
+
+_SNAPSHOT_MAGIC = b"SHOPSNP2"
+
+
+def _check_magic(path: str, found: bytes, expected: bytes) -> None:
+    if found == expected:
+        return
+    if found[:-1] == expected[:-1]:
+        raise ValueError(f"{path} has format {found!r}; this version reads {expected!r} only.")
+    raise ValueError(f"{path} does not start with {expected!r}: written by an older version "
+                     f"without a format header, or not this kind of file.")
+
+
+class ShopStore:
+    """
+    Durable inventory + orders kept in one directory:
+
+        snapshot-<gen>.bin   full state at the start of generation <gen>
+        wal-<gen>.log        mutations made during generation <gen>
+
+    With `snapshot_every`, a snapshot is taken as soon as a group commit
+    brings the log to that many records (checked after each group, so a log
+    holds at most `snapshot_every + group_size - 1` records).
+    """
+
+    def __init__(self, directory: str, group_size: int = 4096, fsync: bool = True,
+                 snapshot_every: Optional[int] = None) -> None:
+        if snapshot_every is not None and snapshot_every < 1:
+            raise ValueError("snapshot_every must be positive.")
+        self.directory = directory
+        self.group_size = group_size
+        self.fsync = fsync
+        self.snapshot_every = snapshot_every
+        os.makedirs(directory, exist_ok=True)
+        self.generation = self._latest_generation()
+        self.inventory, self.orders, replayed = self._recover()
+        self._open_wal(replayed)
+        self._flushed()              # a recovered log that is already too long
+
+    # -- public API --
+
+    def record_order(self, user_email: str, order: Order) -> None:
+        self.orders.setdefault(user_email, []).append(order)
+        self.wal.append(encode_order(user_email, order))
+
+    def record_status(self, user_email: str, order: Order, status: OrderStatus) -> None:
+        order.set_status(status)
+        self.wal.append(encode_status(user_email, order.order_id, status))
+
+    def commit(self) -> None:
+        """Make everything so far durable."""
+        self.wal.flush()
+
+    def snapshot(self) -> None:
+        """Write the full state to a new snapshot and start an empty log."""
+        self.wal.on_flush = None           # this flush must not trigger another snapshot
+        self.wal.flush()
+        new_gen = self.generation + 1
+        path = self._snapshot_path(new_gen)
+        with open(path + ".tmp", "wb") as f:
+            f.write(_SNAPSHOT_MAGIC)
+            f.write(b"".join(encode_product(p) for p in self.inventory._products.values()))
+            f.write(b"".join(encode_order(email, o) for email, orders in self.orders.items() for o in orders))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)   # atomic: a snapshot is either complete or absent
+
+        self.wal.close()
+        old_gen, self.generation = self.generation, new_gen
+        self._open_wal()
+        for old in (self._snapshot_path(old_gen), self._wal_path(old_gen)):
+            if os.path.exists(old):
+                os.remove(old)
+
+    def close(self) -> None:
+        self.wal.flush()                   # may snapshot and switch to a new log
+        self.wal.close()
+
+    # -- internals --
+
+    def _open_wal(self, records: int = 0) -> None:
+        self.wal = WriteAheadLog(self._wal_path(self.generation), self.group_size, self.fsync,
+                                 records, on_flush=self._flushed)
+        self.inventory.wal = self.wal
+
+    def _flushed(self) -> None:
+        """After each group commit: snapshot once the log is `snapshot_every` records long."""
+        if self.snapshot_every is not None and self.wal.records >= self.snapshot_every:
+            self.snapshot()
+
+    def _snapshot_path(self, gen: int) -> str:
+        return os.path.join(self.directory, f"snapshot-{gen}.bin")
+
+    def _wal_path(self, gen: int) -> str:
+        return os.path.join(self.directory, f"wal-{gen}.log")
+
+    def _latest_generation(self) -> int:
+        gens = [int(name[len("snapshot-"):-len(".bin")]) for name in os.listdir(self.directory)
+                if name.startswith("snapshot-") and name.endswith(".bin")]
+        return max(gens, default=0)
+
+    def _recover(self) -> Tuple[LoggedInventory, Dict[str, List[Order]], int]:
+        """State from the newest snapshot + its log, and how many log records were replayed."""
+        # Replay writes products directly, so nothing is logged during recovery
+        inventory = LoggedInventory()
+        orders: Dict[str, List[Order]] = {}
+        replayed = 0
+        snapshot = self._snapshot_path(self.generation)
+        if os.path.exists(snapshot):
+            with open(snapshot, "rb") as f:
+                _check_magic(snapshot, f.read(len(_SNAPSHOT_MAGIC)), _SNAPSHOT_MAGIC)
+                _replay(read_records(f), inventory, orders)
+        wal = self._wal_path(self.generation)
+        if os.path.exists(wal):
+            with open(wal, "r+b") as f:
+                magic = f.read(len(_WAL_MAGIC))
+                if len(magic) < len(_WAL_MAGIC) and _WAL_MAGIC.startswith(magic):
+                    f.truncate(0)           # crashed while writing the header: an empty log
+                else:
+                    _check_magic(wal, magic, _WAL_MAGIC)
+                    end, replayed = _replay(read_records(f), inventory, orders)
+                    # Cut off a torn tail so new records are not appended after garbage
+                    f.truncate(len(_WAL_MAGIC) + end)
+        # New orders must not reuse ids of recovered ones
+        advance_order_ids(max((o.order_id for lst in orders.values() for o in lst), default=0))
+        return inventory, orders, replayed
+
+
+def _replay(records: Iterator[Tuple[int, bytes, int]], inventory: Inventory,
+            orders: Dict[str, List[Order]]) -> Tuple[int, int]:
+    """Apply records to `inventory`/`orders`; return (end offset of the last one applied, count)."""
+    end = count = 0
+    products = inventory._products
+    by_id: Dict[Tuple[str, int], Order] = {(e, o.order_id): o for e, lst in orders.items() for o in lst}
+    for count, (kind, payload, end) in enumerate(records, 1):
+        if kind == STOCK_DELTA:
+            name, pos = _unpack_str(payload, 0)
+            products[name].quantity += _DELTA.unpack_from(payload, pos)[0]
+        elif kind == STOCK_SET:
+            name, pos = _unpack_str(payload, 0)
+            category, pos = _unpack_str(payload, pos)
+            price, qty = _PRICE_QTY.unpack_from(payload, pos)
+            products[name] = Product(name, price, qty, category)
+        elif kind == PRODUCT_REMOVE:
+            name, _ = _unpack_str(payload, 0)
+            del products[name]
+        elif kind == ORDER_PLACED:
+            email, pos = _unpack_str(payload, 0)
+            order_id, subtotal, discount, total, created_at, status, n = _ORDER.unpack_from(payload, pos)
+            pos += _ORDER.size
+            items = []
+            for _ in range(n):
+                name, pos = _unpack_str(payload, pos)
+                price, qty = _PRICE_QTY.unpack_from(payload, pos)
+                pos += _PRICE_QTY.size
+                items.append(CartItem(name, price, qty))
+            order = Order(order_id, items, subtotal, discount, total, OrderStatus(status), created_at)
+            orders.setdefault(email, []).append(order)
+            by_id[email, order_id] = order
+        elif kind == ORDER_STATUS:
+            email, pos = _unpack_str(payload, 0)
+            order_id, status = _STATUS.unpack_from(payload, pos)
+            by_id[email, order_id].set_status(OrderStatus(status))
+        else:
+            raise ValueError(f"Unknown record type {kind}")
+    return end, count
+
+
+# ---------------------------
+# Checks
+# ---------------------------
+
+def check_snapshot_every(mutations: int = 20_000, snapshot_every: int = 1_000, group_size: int = 64) -> None:
+    """Automatic snapshots keep the log short: recovery replays only the records written after the last one."""
+    import random
+    import shutil
+    import tempfile
+
+    from OOP3_Online_Shopping2 import next_order_id
+
+    directory = tempfile.mkdtemp(prefix="shopstore-")
+    try:
+        store = ShopStore(directory, group_size=group_size, fsync=False, snapshot_every=snapshot_every)
+        names = [f"P{i}" for i in range(50)]
+        for name in names:
+            store.inventory.add_product(Product(name, 1.0, 1_000_000, "Misc"))
+        rng = random.Random(0)
+        for i in range(mutations):
+            if i % 100 == 0:
+                carts = [{rng.choice(names): rng.randint(1, 3)} for _ in range(5)]
+                store.inventory.reserve_batch(carts)
+            elif i % 37 == 0:
+                order = Order(next_order_id(), [CartItem(rng.choice(names), 1.0, 1)], 1.0, 0.0, 1.0,
+                              OrderStatus.PAID)
+                store.record_order(f"user{i % 7}", order)
+                store.record_status(f"user{i % 7}", order, OrderStatus.SHIPPED)
+            else:
+                store.inventory.increase_stock(rng.choice(names), 1)
+        store.close()
+        tail = store.wal.records                 # written since the last snapshot
+
+        recovered = ShopStore(directory, group_size=group_size, fsync=False, snapshot_every=snapshot_every)
+        recovered.close()
+        assert store.generation > mutations // (snapshot_every + group_size)
+        assert recovered.generation == store.generation
+        assert recovered.wal.records == tail < snapshot_every + group_size, (recovered.wal.records, tail)
+        stock = {n: p.quantity for n, p in store.inventory._products.items()}
+        assert {n: p.quantity for n, p in recovered.inventory._products.items()} == stock
+        placed = {(e, o.order_id, o.status) for e, lst in store.orders.items() for o in lst}
+        assert {(e, o.order_id, o.status) for e, lst in recovered.orders.items() for o in lst} == placed
+    finally:
+        shutil.rmtree(directory)
+    print(f"snapshot_every={snapshot_every}: {store.generation} snapshots, recovery replayed {tail} records OK")
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(mutations: int = 10_000_000, products: int = 10_000, snapshot_at: float = 0.9,
+              fsync: bool = True) -> None:
+    """Write `mutations` stock changes, snapshot part-way, then time recovery."""
+    import random
+    import shutil
+    import tempfile
+    import time
+
+    directory = tempfile.mkdtemp(prefix="shopstore-")
+    try:
+        store = ShopStore(directory, fsync=fsync)
+        for i in range(products):
+            store.inventory.add_product(Product(f"P{i}", 1.0, 1_000_000_000, "Misc"))
+        names = [f"P{i}" for i in range(products)]
+        rng = random.Random(0)
+        picks = [names[rng.randrange(products)] for _ in range(1024)]
+
+        t0 = time.perf_counter()
+        snap_after = int(mutations * snapshot_at)
+        for i in range(mutations):
+            store.inventory.increase_stock(picks[i & 1023], 1)
+            if i == snap_after:
+                t_snap = time.perf_counter()
+                store.snapshot()
+                t_snap = time.perf_counter() - t_snap
+        store.close()
+        t_write = time.perf_counter() - t0
+        expected = {n: p.quantity for n, p in store.inventory._products.items()}
+
+        t0 = time.perf_counter()
+        recovered = ShopStore(directory, fsync=fsync)
+        t_recover = time.perf_counter() - t0
+        recovered.close()
+        ok = {n: p.quantity for n, p in recovered.inventory._products.items()} == expected
+
+        tail = mutations - snap_after - 1
+        print(f"{mutations:,} stock mutations on {products:,} products (fsync={fsync})")
+        print(f"  write   : {t_write:7.2f}s  ({mutations / t_write:12,.0f} mutations/s)")
+        print(f"  snapshot: {t_snap * 1e3:7.1f} ms")
+        print(f"  recovery: {t_recover:7.2f}s  (snapshot + {tail:,} log records)")
+        print(f"  recovered state matches: {ok}")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    from OOP3_Online_Shopping2 import PaymentProcessor, User
+
+    directory = tempfile.mkdtemp(prefix="shopstore-")
+    store = ShopStore(directory)
+    store.inventory.add_product(Product("Water", 1.00, 20, "Drinks"))
+    store.inventory.add_product(Product("Chocolate", 3.75, 40, "Snacks"))
+    user = User("Sina", "sina@g.com", "Altstadt 11, 4600 Wels")
+    user.cart.add(store.inventory.get("Chocolate"), 30)
+    store.record_order(user.email, user.place_order(store.inventory, PaymentProcessor()))
+    store.snapshot()
+    store.inventory.increase_stock("Water", 5)
+    store.commit()
+    store.close()   # "crash" / restart
+
+    restarted = ShopStore(directory)
+    print("💾 Recovered inventory:", restarted.inventory)
+    print("🧾 Recovered orders   :", restarted.orders)
+    restarted.close()
+    shutil.rmtree(directory)
+    check_snapshot_every()
+
+    print("\n⏱️  Benchmark")
+    benchmark(1_000_000)
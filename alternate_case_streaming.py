@@ -0,0 +1,123 @@
+"""
+Streaming version of `alternate_case` (see alternate_case.py).
+
+`alternate_case(text)` calls `lower()`/`upper()` and `append()` once per
+character and joins at the end. For large logs and text streams we work on
+whole chunks instead:
+
+- the index parity is carried from one chunk to the next, so any chunking
+  gives the same text as `alternate_case` on the whole input
+- ASCII chunks: encode once, then `bytes.translate` the even and the odd
+  bytes (extended slices) with a lowercase and an uppercase table
+- other chunks: `lower()` the even-index slice and `upper()` the odd-index
+  slice in one call each, then interleave the two as UTF-32 code units in
+  an `array`. The ~100 characters whose case mapping changes the length
+  ('ß' -> 'SS', 'İ' -> 'i̇') or depends on context (Greek capital sigma)
+  are cut out with a regex and done one by one, so results always match
+"""
+
+import re
+import sys
+from array import array
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+_LOWER = bytes(range(256)).translate(bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                                                     b"abcdefghijklmnopqrstuvwxyz"))
+_UPPER = bytes(range(256)).translate(bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz",
+                                                     b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+
+def _per_char(text: str, start: int) -> str:
+    """The original loop, for special characters and short pieces."""
+    return ''.join(c.lower() if (i + start) % 2 == 0 else c.upper() for i, c in enumerate(text))
+
+
+@lru_cache(maxsize=None)
+def _special() -> "re.Pattern":
+    """Characters that `str.lower()`/`upper()` on a slice would not map one to one (built once)."""
+    chars = [c for c in map(chr, range(sys.maxunicode + 1))
+             if len(c.lower()) != 1 or len(c.upper()) != 1 or c == "Σ"]
+    return re.compile("[" + "".join(re.escape(c) for c in chars) + "]")
+
+
+def _bulk(text: str, start: int) -> str:
+    """Slice lower()/upper() for text without special characters."""
+    if len(text) < 32:                  # short pieces: the setup costs more than the loop
+        return _per_char(text, start)
+    low = start % 2                     # where the lowercase (even-index) slice starts
+    high = 1 - low
+    lowered, uppered = text[low::2].lower(), text[high::2].upper()
+    try:
+        out = array("I", bytes(4 * len(text)))
+        out[low::2] = array("I", lowered.encode("utf-32-le"))
+        out[high::2] = array("I", uppered.encode("utf-32-le"))
+        return out.tobytes().decode("utf-32-le")
+    except UnicodeError:                # lone surrogates cannot round-trip through UTF-32
+        return _per_char(text, start)
+
+
+def alternate_case_chunk(text: str, start: int = 0) -> str:
+    """`alternate_case` of `text`, as if it started at index `start` of a longer text."""
+    if text.isascii():
+        low = start % 2
+        data = text.encode("ascii")
+        out = bytearray(data)
+        out[low::2] = data[low::2].translate(_LOWER)
+        out[1 - low::2] = data[1 - low::2].translate(_UPPER)
+        return out.decode("ascii")
+
+    parts, pos = [], 0
+    for m in _special().finditer(text):
+        i = m.start()
+        parts.append(_bulk(text[pos:i], start + pos))
+        parts.append(_per_char(m.group(), start + i))
+        pos = i + 1
+    parts.append(_bulk(text[pos:], start + pos))
+    return ''.join(parts)
+
+
+def alternate_case_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """Transform a stream of str chunks, keeping the index parity across chunks."""
+    position = 0
+    for chunk in chunks:
+        yield alternate_case_chunk(chunk, position)
+        position += len(chunk)
+
+
+def alternate_case_file(src: str, dst: str, chunk_size: int = 1 << 22, encoding: str = "utf-8") -> None:
+    """Transform a text file of any size, `chunk_size` characters at a time."""
+    with open(src, encoding=encoding, newline="") as fin, \
+            open(dst, "w", encoding=encoding, newline="") as fout:
+        for out in alternate_case_stream(iter(lambda: fin.read(chunk_size), "")):
+            fout.write(out)
+
+
+def benchmark(size_mb: int = 64) -> None:
+    import time
+
+    from alternate_case import alternate_case
+
+    line = "2024-05-01 12:00:03 INFO  Soheil logged in from 10.0.0.1 (Wels)\n"
+    text = line * (size_mb * (1 << 20) // len(line))
+    accented = ("Ünïcödé café in Zürich, naïve Ελλάδα " + line) * (len(text) // (len(line) + 37) // 8)
+    special = ("straße İstanbul ΟΔΥΣΣΕΥΣ " + line) * (len(text) // (len(line) + 26) // 8)
+    for name, sample in (("ASCII", text), ("accented", accented), ("ß/İ/Σ", special)):
+        mb = len(sample.encode()) / 1e6
+        t0 = time.perf_counter()
+        expected = alternate_case(sample)
+        t_orig = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        got = ''.join(alternate_case_stream(sample[i:i + (1 << 20) + 1] for i in range(0, len(sample), (1 << 20) + 1)))
+        t_stream = time.perf_counter() - t0
+        print(f"{name:9s} ({mb:5.1f} MB): alternate_case {mb / t_orig:7.1f} MB/s, "
+              f"streaming {mb / t_stream:7.1f} MB/s, same: {got == expected}")
+
+
+# Execute:
+if __name__ == "__main__":
+    print(''.join(alternate_case_stream(['soh', 'eil'])))     # sOhEiL, same as alternate_case('soheil')
+    print(alternate_case_chunk('straße', 0))                  # sTrAßE
+
+    print("\nBenchmark:")
+    benchmark()
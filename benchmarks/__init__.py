@@ -0,0 +1,31 @@
+"""
+⏱️ Benchmarks for the knowledge-base examples
+---------------------------------------------
+The functions we copy into production (bubble_sort, letter_frequency,
+alternate_case, reverse, merging_dictionaries, sorted_dict,
+ShoppingCart.subtotal) are benchmarked from their original files:
+
+- `loader.load_definitions` runs only a file's imports, functions, classes
+  and assignments, so module-level print()/input() demos never run
+- every case sweeps several input sizes and records the best time,
+  throughput (items/s) and peak traced memory
+- each timed call is paired with a fixed reference workload, and the
+  time relative to it is what gets compared, so a slower machine or a
+  busy neighbour on a shared VM does not look like a regression
+- results are written to JSON and compared with a stored baseline;
+  anything slower (or bigger) than the threshold, and still slower when
+  re-measured, counts as a regression
+
+Run from the repository root, offline:
+
+    python -m benchmarks                              # compare with benchmarks/baseline.json
+    python -m benchmarks --quick --output out.json
+    python -m benchmarks --save-baseline              # record a new baseline
+    python -m benchmarks.importtime                   # cold import times of `foundations`
+"""
+
+from .cases import CASES, Case
+from .loader import load_definitions
+from .runner import compare, main, measure, run
+
+__all__ = ["CASES", "Case", "compare", "load_definitions", "main", "measure", "run"]
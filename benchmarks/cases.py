@@ -0,0 +1,86 @@
+"""The benchmarked functions, each with its input sizes and input generator."""
+
+import random
+import string
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+from .loader import load_definitions
+
+# prepare(module, size) -> (run, items): `run()` is the timed call and
+# `items` the number of elements it processes (for items/s)
+Prepared = Tuple[Callable[[], object], int]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    path: str                                       # relative to the repository root
+    prepare: Callable[[object, int], Prepared]
+    sizes: Tuple[int, ...]
+
+    def load(self):
+        return load_definitions(self.path)
+
+
+def _text(size: int) -> str:
+    rng = random.Random(size)
+    alphabet = string.ascii_letters + "      .,!?0123456789äöüß"
+    return "".join(rng.choices(alphabet, k=size))
+
+
+def _ints(size: int, high: int = 10 ** 9) -> list:
+    rng = random.Random(size)
+    return [rng.randrange(-high, high) for _ in range(size)]
+
+
+def _bubble_sort(module, size: int) -> Prepared:
+    data = _ints(size)
+    return (lambda: module.bubble_sort(data)), size
+
+
+def _letter_frequency(module, size: int) -> Prepared:
+    text = _text(size)
+    return (lambda: module.letter_frequency(text)), size
+
+
+def _alternate_case(module, size: int) -> Prepared:
+    text = _text(size)
+    return (lambda: module.alternate_case(text)), size
+
+
+def _reverse(module, size: int) -> Prepared:
+    values = _ints(size, 10 ** 15)
+    reverse = module.reverse
+    return (lambda: [reverse(x) for x in values]), size
+
+
+def _merging_dictionaries(module, size: int) -> Prepared:
+    first = {f"k{i}": i for i in range(size)}
+    second = {f"k{i}": -i for i in range(size // 2, size + size // 2)}
+    return (lambda: module.merging_dictionaries(first, second)), 2 * size
+
+
+def _sorted_dict(module, size: int) -> Prepared:
+    values = _ints(size)
+    data = {f"k{i}": v for i, v in enumerate(values)}
+    return (lambda: module.sorted_dict(data)), size
+
+
+def _cart_subtotal(module, size: int) -> Prepared:
+    """`size` lines in the cart; the subtotal is read once per line."""
+    cart = module.ShoppingCart()
+    for i in range(size):
+        cart.add(module.Product(f"P{i}", 1.0 + i % 7, 10, "Misc"), quantity=1 + i % 3)
+    return (lambda: [cart.subtotal for _ in range(size)]), size
+
+
+CASES: Dict[str, Case] = {case.name: case for case in (
+    Case("bubble_sort", "function/custom_functions/Bubble_sorting.py", _bubble_sort, (100, 300, 1_000)),
+    Case("letter_frequency", "letter_frequecny.py", _letter_frequency, (10_000, 100_000, 1_000_000)),
+    Case("alternate_case", "alternate_case.py", _alternate_case, (10_000, 100_000, 1_000_000)),
+    Case("reverse", "rev.py", _reverse, (1_000, 10_000, 100_000)),
+    Case("merging_dictionaries", "Dict2.py", _merging_dictionaries, (1_000, 10_000, 100_000)),
+    Case("sorted_dict", "Dict2.py", _sorted_dict, (1_000, 10_000, 100_000)),
+    Case("ShoppingCart.subtotal", "OOP/OOP3_Online_Shopping2.py", _cart_subtotal, (100, 1_000, 10_000)),
+)}
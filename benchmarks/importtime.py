@@ -0,0 +1,101 @@
+"""
+Cold import times of the `foundations` package.
+
+Every measurement runs in fresh interpreters, timed from inside them (the
+scripts are loaded from their files by importlib, which `-X importtime`
+does not report). `import foundations` itself,
+every submodule and all of them together get a budget in milliseconds,
+and modules that only use NumPy in some functions must not load it on
+import. Exits with 1 when anything is over budget:
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --package-budget 5 --total-budget 500
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+from .loader import ROOT
+
+PACKAGE_BUDGET_MS = 10.0        # import foundations (nothing but importlib.machinery)
+MODULE_BUDGET_MS = 80.0         # one submodule, NumPy not included
+NUMPY_BUDGET_MS = 400.0         # one submodule that needs NumPy at import
+TOTAL_BUDGET_MS = 800.0         # every submodule, in one interpreter
+
+# Modules built on NumPy arrays throughout; everything else must import without it
+NUMPY_MODULES = {"bank_journal", "bank_ledger", "columnar_inventory", "elementwise"}
+# Modules whose whole point is a heavy standard-library package
+OWN_BUDGET_MS = {"async_checkout": 150.0}          # asyncio alone is ~90 ms
+REPEAT = 3                      # best of this many fresh interpreters per measurement
+
+
+# Runs in a fresh interpreter: seconds for `import foundations`, then for the submodules
+_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+import foundations
+t1 = time.perf_counter()
+for name in {names!r}:
+    foundations._import(name)
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1, "numpy" in sys.modules)
+"""
+
+
+def _probe(names: List[str]) -> Tuple[float, float, bool]:
+    proc = subprocess.run([sys.executable, "-c", _PROBE.format(names=names)], cwd=ROOT,
+                          stdin=subprocess.DEVNULL, capture_output=True, text=True, check=True)
+    package, modules, numpy_loaded = proc.stdout.split()
+    return float(package) * 1e3, float(modules) * 1e3, numpy_loaded == "True"
+
+
+def measure(name: Optional[str] = None, repeat: int = REPEAT) -> Tuple[float, float, bool]:
+    """
+    (ms for `import foundations`, ms for submodule `name` on top of it, NumPy loaded):
+    the fastest of `repeat` fresh interpreters. name="*" imports every submodule.
+    """
+    from foundations import MODULES
+
+    names = list(MODULES) if name == "*" else [name] if name else []
+    runs = [_probe(names) for _ in range(repeat)]
+    return min(run[0] for run in runs), min(run[1] for run in runs), runs[0][2]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--package-budget", type=float, default=PACKAGE_BUDGET_MS)
+    parser.add_argument("--module-budget", type=float, default=MODULE_BUDGET_MS)
+    parser.add_argument("--numpy-budget", type=float, default=NUMPY_BUDGET_MS)
+    parser.add_argument("--total-budget", type=float, default=TOTAL_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    from foundations import MODULES
+
+    failures = []
+    package_ms, _, numpy_loaded = measure()
+    print(f"{'import foundations':34s} {package_ms:8.1f} ms")
+    if package_ms > args.package_budget or numpy_loaded:
+        failures.append(f"import foundations: {package_ms:.1f} ms (budget {args.package_budget:.0f} ms)")
+    for name in MODULES:
+        _, ms, numpy_loaded = measure(name)
+        budget = OWN_BUDGET_MS.get(name, args.numpy_budget if name in NUMPY_MODULES else args.module_budget)
+        print(f"  {name:32s} {ms:8.1f} ms{'  (NumPy)' if numpy_loaded else ''}")
+        if numpy_loaded and name not in NUMPY_MODULES:
+            failures.append(f"{name}: imports NumPy on import")
+        if ms > budget:
+            failures.append(f"{name}: {ms:.1f} ms (budget {budget:.0f} ms)")
+    _, total, _ = measure("*")
+    total += package_ms
+    print(f"{'whole package, one interpreter':34s} {total:8.1f} ms")
+    if total > args.total_budget:
+        failures.append(f"whole package: {total:.1f} ms (budget {args.total_budget:.0f} ms)")
+    for failure in failures:
+        print(f"OVER BUDGET {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+"""Load a script's definitions without running its demo code."""
+
+import ast
+import functools
+import sys
+import types
+from pathlib import Path
+from typing import Union
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_KEEP = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+         ast.Assign, ast.AnnAssign)
+_DEMO_CALLS = {"print", "input"}
+
+
+def _is_demo(node: ast.stmt) -> bool:
+    """Statements that are not definitions, or assignments that print or prompt."""
+    if not isinstance(node, _KEEP):
+        return True
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        return any(isinstance(sub, ast.Call) and isinstance(sub.func, ast.Name)
+                   and sub.func.id in _DEMO_CALLS for sub in ast.walk(node))
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def load_definitions(path: Union[str, Path]) -> types.ModuleType:
+    """
+    The module at `path` (relative to the repository root) with only its
+    top-level imports, functions, classes and assignments executed.
+    Its directory is put on sys.path first, as when the script is run directly,
+    and the repository root after it, for package imports such as `playbox.pattern`.
+    """
+    path = (ROOT / path).resolve()
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    tree.body = [node for node in tree.body if not _is_demo(node)]
+    # Own name, so it never shadows the module if that is imported normally
+    module = types.ModuleType(f"benchmarks.loaded.{path.stem}")
+    module.__file__ = str(path)
+    sys.modules[module.__name__] = module          # dataclasses look their module up here
+    for folder in (str(ROOT), str(path.parent)):
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+    exec(compile(tree, str(path), "exec"), module.__dict__)
+    return module
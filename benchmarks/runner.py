@@ -0,0 +1,145 @@
+"""Run the cases, write JSON, compare with a baseline."""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cases import CASES, Case
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+THRESHOLD = 0.5                 # 50% slower (or more memory) fails; even relative timings jitter ~30%
+MIN_SECONDS = 1e-4              # faster timings are noise; never compared
+MIN_BYTES = 1 << 16             # smaller peaks are noise; never compared
+
+
+def _reference() -> None:
+    """Fixed pure-Python workload; timed next to every case to factor out machine speed."""
+    counts = {}
+    for i in range(20_000):
+        key = i & 1023
+        counts[key] = counts.get(key, 0) + i
+
+
+def measure(case: Case, size: int, repeat: int = 5) -> Dict[str, float]:
+    """
+    Best of `repeat` timed calls (fresh input each time, GC off), then one
+    traced call for memory. Each call is paired with a run of `_reference`;
+    `relative` = seconds / reference time is what `compare` checks, so a
+    slow phase of a shared machine slows both and cancels out.
+    """
+    module = case.load()
+    best = reference = float("inf")
+    for _ in range(repeat):
+        run, items = case.prepare(module, size)
+        gc.collect()
+        gc.disable()
+        t0 = time.perf_counter()
+        _reference()
+        t1 = time.perf_counter()
+        run()
+        t2 = time.perf_counter()
+        gc.enable()
+        reference = min(reference, t1 - t0)
+        best = min(best, t2 - t1)
+    run, items = case.prepare(module, size)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"items": items, "seconds": best, "items_per_s": items / best,
+            "relative": best / reference, "peak_bytes": peak}
+
+
+def run(names: Optional[Iterable[str]] = None, quick: bool = False, repeat: int = 5,
+        log=sys.stdout) -> dict:
+    """Results for the named cases (all by default) at every size (only the smallest with `quick`)."""
+    results = {}
+    for name in names or CASES:
+        case = CASES[name]
+        results[name] = {}
+        for size in case.sizes[:1] if quick else case.sizes:
+            r = measure(case, size, repeat)
+            results[name][str(size)] = r
+            if log:
+                print(f"{name:24s} {size:>10,}  {r['seconds'] * 1e3:10.3f} ms  "
+                      f"{r['items_per_s']:14,.0f} items/s  {r['peak_bytes'] / 2 ** 20:8.2f} MB", file=log)
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> List[Tuple[str, str, str]]:
+    """(case, size, message) for every regression of `current` against `baseline`."""
+    regressions = []
+    for name, sizes in current["results"].items():
+        for size, r in sizes.items():
+            base = baseline.get("results", {}).get(name, {}).get(size)
+            if base is None:
+                continue
+            key = "relative" if "relative" in base else "seconds"
+            if r[key] > base[key] * (1 + threshold) and base["seconds"] >= MIN_SECONDS:
+                regressions.append((name, size, f"{r['seconds'] * 1e3:.3f} ms vs {base['seconds'] * 1e3:.3f} ms "
+                                                f"({r[key] / base[key] - 1:+.0%} {key})"))
+            if r["peak_bytes"] > base["peak_bytes"] * (1 + threshold) and r["peak_bytes"] >= MIN_BYTES:
+                regressions.append((name, size, f"peak {r['peak_bytes'] / 2 ** 20:.2f} MB vs "
+                                                f"{base['peak_bytes'] / 2 ** 20:.2f} MB"))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("cases", nargs="*", metavar="case",
+                        help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--quick", action="store_true", help="only the smallest size of each case")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per size (best is kept)")
+    parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown / memory growth as a fraction (default 0.5)")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="re-measure a suspected regression this often before reporting it")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    current = run(args.cases, quick=args.quick, repeat=args.repeat)
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(current, baseline, args.threshold)
+    for _ in range(args.retries):
+        if not regressions:
+            break
+        # Timings on a shared machine jump around; only what stays slow is real
+        for name, size in {(name, size) for name, size, _ in regressions}:
+            again = measure(CASES[name], int(size), args.repeat)
+            kept = current["results"][name][size]
+            kept["seconds"] = min(kept["seconds"], again["seconds"])
+            kept["items_per_s"] = kept["items"] / kept["seconds"]
+            kept["relative"] = min(kept["relative"], again["relative"])
+            kept["peak_bytes"] = min(kept["peak_bytes"], again["peak_bytes"])
+        regressions = compare(current, baseline, args.threshold)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2))
+    if not baseline:
+        print(f"No baseline at {args.baseline}; nothing to compare.")
+        return 0
+    for name, size, message in regressions:
+        print(f"REGRESSION {name} [{size}]: {message}")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} against {args.baseline.name}")
+    return 1 if regressions else 0
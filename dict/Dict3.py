@@ -8,31 +8,32 @@
 # you want to update your profile quickly.
 # -------------------------------------------------
 
-# Default profile (all values missing initially)
-profile = {
-    'name': 'N/A',
-    'Email': 'N/A',
-    'phone': 'N/A'
-}
+# Execute:
+if __name__ == "__main__":
+    # Default profile (all values missing initially)
+    profile = {
+        'name': 'N/A',
+        'Email': 'N/A',
+        'phone': 'N/A'
+    }
 
-# Incoming user info (new data to merge into profile)
-user_info = {
-    'name': 'Ali',
-    'Email': 'ali@x.com'
-    # Note: 'phone' is not included here,
-    # so the default "N/A" will remain.
-}
+    # Incoming user info (new data to merge into profile)
+    user_info = {
+        'name': 'Ali',
+        'Email': 'ali@x.com'
+        # Note: 'phone' is not included here,
+        # so the default "N/A" will remain.
+    }
 
-# Merge dictionaries using |= (Python 3.9+).
-# This updates the existing profile in-place
-# with the new values from user_info.
-profile |= user_info
+    # Merge dictionaries using |= (Python 3.9+).
+    # This updates the existing profile in-place
+    # with the new values from user_info.
+    profile |= user_info
 
-# 🎉 Print the updated profile
-print("Profile successfully updated:")
-print(profile)
-
-# Output:
-# Profile successfully updated:
-# {'name': 'Ali', 'Email': 'ali@x.com', 'phone': 'N/A'}
+    # 🎉 Print the updated profile
+    print("Profile successfully updated:")
+    print(profile)
 
+    # Output:
+    # Profile successfully updated:
+    # {'name': 'Ali', 'Email': 'ali@x.com', 'phone': 'N/A'}
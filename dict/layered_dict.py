@@ -0,0 +1,196 @@
+"""
+🧅 Layered Dictionary (lazy merge)
+----------------------------------
+`merging_dictionaries` in Dict2.py copies the first dict and `update`s it
+with the second, and the profile updater in Dict3.py does `profile |=
+user_info`. Both cost O(size of everything) per merge. Layering dozens of
+big config/profile dicts on every request therefore copies the same
+millions of keys again and again.
+
+`LayeredDict` keeps references to the layers instead (no copying):
+
+- later layers win, exactly like `merging_dictionaries(dic1, dic2)`
+- `push(layer)` / `merged_with(...)` are O(1)
+- a lookup checks the layers from the newest down and caches the answer;
+  a cached key only re-checks layers pushed after it was cached
+- iteration, `len()` and `flatten()` build the merged dict once, lazily,
+  and only apply newly pushed layers afterwards
+
+The layers are shared, not copied: do not mutate them while a
+`LayeredDict` uses them (or call `invalidate()` after you do).
+
+`merge_many(dicts)` is the eager k-way version: one result dict filled
+with C-level `dict.update` calls, instead of a fresh copy per pair.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def merge_many(dicts: List[Mapping]) -> dict:
+    """Merge any number of dicts in one pass; later dicts win."""
+    merged: dict = {}
+    for d in dicts:
+        merged.update(d)
+    return merged
+
+
+class LayeredDict(Mapping):
+    """Read-only view of several dicts merged with last-writer-wins."""
+
+    def __init__(self, *layers: Mapping) -> None:
+        self._layers: List[Mapping] = list(layers)
+        self._cache: Dict[Any, Tuple[Any, int]] = {}  # key -> (value or _MISSING, layers checked)
+        self._flat: Optional[dict] = None
+        self._flat_layers = 0
+
+    # -----------------------------
+    # Layering
+    # -----------------------------
+    def push(self, layer: Mapping) -> "LayeredDict":
+        """Put `layer` on top (it wins over everything below). O(1)."""
+        self._layers.append(layer)
+        return self
+
+    def merged_with(self, *layers: Mapping) -> "LayeredDict":
+        """New LayeredDict with extra layers on top; this one is unchanged. O(number of layers)."""
+        return LayeredDict(*self._layers, *layers)
+
+    @property
+    def layers(self) -> Tuple[Mapping, ...]:
+        return tuple(self._layers)
+
+    def invalidate(self) -> None:
+        """Forget cached lookups (call after mutating a layer in place)."""
+        self._cache.clear()
+        self._flat = None
+        self._flat_layers = 0
+
+    # -----------------------------
+    # Lookup
+    # -----------------------------
+    def _lookup(self, key: Any) -> Any:
+        layers = self._layers
+        depth = len(layers)
+        if self._flat is not None and self._flat_layers == depth:
+            return self._flat.get(key, _MISSING)
+
+        cached = self._cache.get(key)
+        floor = cached[1] if cached is not None else 0
+        for i in range(depth - 1, floor - 1, -1):     # newest first, stop at what the cache covers
+            value = layers[i].get(key, _MISSING)
+            if value is not _MISSING:
+                break
+        else:
+            value = cached[0] if cached is not None else _MISSING
+        self._cache[key] = (value, depth)
+        return value
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    # -----------------------------
+    # Whole-mapping operations (flatten lazily)
+    # -----------------------------
+    def flatten(self) -> dict:
+        """The merged dict (same content and key order as chained `merging_dictionaries`)."""
+        if self._flat is None:
+            self._flat, self._flat_layers = {}, 0
+        if self._flat_layers < len(self._layers):
+            for layer in self._layers[self._flat_layers:]:
+                self._flat.update(layer)
+            self._flat_layers = len(self._layers)
+            self._cache.clear()
+        return self._flat
+
+    def __iter__(self) -> Iterator:
+        return iter(self.flatten())
+
+    def __len__(self) -> int:
+        return len(self.flatten())
+
+    def to_dict(self) -> dict:
+        """An independent copy of the merged dict."""
+        return dict(self.flatten())
+
+    def __repr__(self) -> str:
+        return f"LayeredDict({len(self._layers)} layers)"
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(base_keys: int = 1_000_000, overlays: int = 24, overlay_keys: int = 1_000,
+              lookups: int = 10_000, requests: int = 5) -> None:
+    """Per-request layering of a 1M-key base with many small overlays, plus a bulk k-way merge."""
+    import random
+    import time
+
+    def merging_dictionaries(dic1, dic2):              # Dict2.py
+        merg = dic1.copy()
+        merg.update(dic2)
+        return merg
+
+    rng = random.Random(0)
+    base = {f"key{i}": i for i in range(base_keys)}
+    layers = [{f"key{rng.randrange(base_keys)}": -j for j in range(overlay_keys)} for _ in range(overlays)]
+    probe = [f"key{rng.randrange(base_keys)}" for _ in range(lookups)]
+
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        merged = base
+        for layer in layers:
+            merged = merging_dictionaries(merged, layer)
+        expected = [merged[k] for k in probe]
+    t_copy = (time.perf_counter() - t0) / requests
+
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        view = LayeredDict(base, *layers)
+        got = [view[k] for k in probe]
+    t_lazy = (time.perf_counter() - t0) / requests
+
+    big = [{f"key{rng.randrange(base_keys)}": j for j in range(base_keys // 4)} for _ in range(4)]
+    big.insert(0, base)
+    t0 = time.perf_counter()
+    pairwise = big[0]
+    for d in big[1:]:
+        pairwise = merging_dictionaries(pairwise, d)
+    t_pairwise = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    bulk = merge_many(big)
+    t_bulk = time.perf_counter() - t0
+
+    print(f"{base_keys:,}-key base + {overlays} overlays, {lookups:,} lookups per request")
+    print(f"  copy + update chain : {t_copy * 1e3:9.2f} ms/request")
+    print(f"  LayeredDict         : {t_lazy * 1e3:9.2f} ms/request (same values: {got == expected})")
+    print(f"{len(big)}-way merge of {sum(map(len, big)):,} entries")
+    print(f"  pairwise copies     : {t_pairwise * 1e3:9.2f} ms")
+    print(f"  merge_many          : {t_bulk * 1e3:9.2f} ms (same: {bulk == pairwise})")
+
+
+# Execute:
+if __name__ == "__main__":
+    defaults = {'name': 'N/A', 'Email': 'N/A', 'phone': 'N/A'}
+    user_info = {'name': 'Ali', 'Email': 'ali@x.com'}
+    profile = LayeredDict(defaults, user_info)
+    print(profile['name'], profile['phone'])      # Ali N/A
+    profile.push({'phone': '0660 123'})
+    print(profile.flatten())                      # {'name': 'Ali', 'Email': 'ali@x.com', 'phone': '0660 123'}
+    print(defaults)                               # untouched
+
+    print("\n⏱️  Benchmark")
+    benchmark()
@@ -0,0 +1,286 @@
+"""
+🏆 Dictionary kept sorted by value
+----------------------------------
+`sorted_dict()` in Dict2.py sorts every item again on each call:
+O(n log n) per read, even if only a handful of scores changed. For
+leaderboards we keep the order up to date instead.
+
+`SortedValueDict` is a normal key -> value mapping whose iteration order is
+by value (ties keep insertion order, exactly like `sorted_dict`). It is
+stored as a *blocked sorted list*: the entries `(value, seq, key)` live in
+short sorted lists ("blocks") of ~`load` entries, so an insert or delete
+shifts one small list instead of one huge one. A Fenwick tree over the
+block lengths turns "how many entries are before this block" into an
+O(log n) query, which gives:
+
+    set / delete        O(log n + load)
+    rank(key)           O(log n)
+    peekitem(i)         O(log n)        (i-th smallest; negative from the top)
+    top(k), bottom(k)   O(log n + k)
+    value_range(lo, hi) O(log n + size of the answer)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Entry = Tuple[Any, int, Any]   # (value, insertion sequence, key)
+
+
+class SortedValueDict(MutableMapping):
+    """Mapping whose keys iterate in ascending order of their values."""
+
+    def __init__(self, data: Optional[Iterable] = None, load: int = 512) -> None:
+        self._load = load
+        self._values: Dict[Any, Any] = {}
+        self._seq: Dict[Any, int] = {}
+        self._next_seq = 0
+        self._blocks: List[List[Entry]] = []
+        self._maxes: List[Entry] = []
+        self._tree: List[int] = [0]
+        if data is not None:
+            items = data.items() if hasattr(data, "items") else data
+            for key, value in items:
+                if key not in self._seq:
+                    self._seq[key] = self._next_seq
+                    self._next_seq += 1
+                self._values[key] = value
+            # Bulk load: one sort instead of n inserts
+            entries = sorted((v, self._seq[k], k) for k, v in self._values.items())
+            self._blocks = [entries[i:i + load] for i in range(0, len(entries), load)]
+            self._maxes = [block[-1] for block in self._blocks]
+            self._rebuild_tree()
+
+    # -----------------------------
+    # Fenwick tree over block lengths
+    # -----------------------------
+    def _rebuild_tree(self) -> None:
+        tree = [0] + [len(block) for block in self._blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, block: int, delta: int) -> None:
+        tree = self._tree
+        i = block + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _entries_before(self, block: int) -> int:
+        tree, i, total = self._tree, block, 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """(block, position) of the index-th entry."""
+        tree = self._tree
+        block, step = 0, 1 << (len(tree).bit_length())
+        while step:
+            nxt = block + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                block = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return block, index
+
+    # -----------------------------
+    # Blocked sorted list
+    # -----------------------------
+    def _insert(self, entry: Entry) -> None:
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            self._rebuild_tree()
+            return
+        i = min(bisect_left(self._maxes, entry), len(self._blocks) - 1)
+        block = self._blocks[i]
+        insort(block, entry)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self._load:
+            self._blocks[i:i + 1] = [block[:self._load], block[self._load:]]
+            self._maxes[i:i + 1] = [block[self._load - 1], block[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(i, 1)
+
+    def _remove(self, entry: Entry) -> None:
+        i = bisect_left(self._maxes, entry)
+        block = self._blocks[i]
+        del block[bisect_left(block, entry)]
+        if block:
+            self._maxes[i] = block[-1]
+            self._tree_add(i, -1)
+        else:
+            del self._blocks[i], self._maxes[i]
+            self._rebuild_tree()
+
+    def _entry(self, key: Any) -> Entry:
+        return self._values[key], self._seq[key], key
+
+    # -----------------------------
+    # Mapping interface
+    # -----------------------------
+    def __getitem__(self, key: Any) -> Any:
+        return self._values[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self._values:
+            if self._values[key] == value:
+                return
+            self._remove(self._entry(key))
+        else:
+            self._seq[key] = self._next_seq
+            self._next_seq += 1
+        self._values[key] = value
+        self._insert(self._entry(key))
+
+    def __delitem__(self, key: Any) -> None:
+        self._remove(self._entry(key))
+        del self._values[key], self._seq[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator:
+        """Keys in ascending order of value."""
+        for block in self._blocks:
+            for entry in block:
+                yield entry[2]
+
+    def __reversed__(self) -> Iterator:
+        """Keys in descending order of value."""
+        for block in reversed(self._blocks):
+            for entry in reversed(block):
+                yield entry[2]
+
+    def sorted_items(self, reverse: bool = False) -> Iterator[Tuple[Any, Any]]:
+        keys = reversed(self) if reverse else iter(self)
+        values = self._values
+        return ((key, values[key]) for key in keys)
+
+    # -----------------------------
+    # Order queries
+    # -----------------------------
+    def rank(self, key: Any) -> int:
+        """Number of entries before `key` in ascending order (0 = smallest value)."""
+        entry = self._entry(key)
+        i = bisect_left(self._maxes, entry)
+        return self._entries_before(i) + bisect_left(self._blocks[i], entry)
+
+    def peekitem(self, index: int = -1) -> Tuple[Any, Any]:
+        """(key, value) at a position in ascending order; -1 is the largest value."""
+        n = len(self._values)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("SortedValueDict index out of range")
+        block, pos = self._locate(index)
+        value, _, key = self._blocks[block][pos]
+        return key, value
+
+    def top(self, k: int) -> List[Tuple[Any, Any]]:
+        """The k largest values, largest first."""
+        return list(islice(self.sorted_items(reverse=True), k))
+
+    def bottom(self, k: int) -> List[Tuple[Any, Any]]:
+        """The k smallest values, smallest first."""
+        return list(islice(self.sorted_items(), k))
+
+    def value_range(self, low: Any, high: Any) -> List[Tuple[Any, Any]]:
+        """Items with low <= value <= high, ascending."""
+        start = (low, -1)                      # sorts before every entry with value == low
+        out = []
+        i = bisect_left(self._maxes, start)
+        if i == len(self._blocks):
+            return out
+        pos = bisect_left(self._blocks[i], start)
+        for block in self._blocks[i:]:
+            for value, _, key in block[pos:]:
+                if value > high:
+                    return out
+                out.append((key, value))
+            pos = 0
+        return out
+
+    def count_range(self, low: Any, high: Any) -> int:
+        """How many values lie in [low, high], in O(log n)."""
+        return self._position((high, self._next_seq)) - self._position((low, -1))
+
+    def _position(self, probe: Tuple) -> int:
+        i = bisect_left(self._maxes, probe)
+        if i == len(self._blocks):
+            return len(self._values)
+        return self._entries_before(i) + bisect_right(self._blocks[i], probe)
+
+    def __repr__(self) -> str:
+        return f"SortedValueDict({dict(self.sorted_items())})"
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(keys: int = 1_000_000, update_rate: float = 0.01, rounds: int = 5, k: int = 10) -> None:
+    """Leaderboard: change `update_rate` of the scores, then read the top k, repeated `rounds` times."""
+    import random
+    import time
+
+    def sorted_dict(x):                                  # Dict2.py
+        return dict(sorted(x.items(), key=lambda item: item[1]))
+
+    rng = random.Random(0)
+    scores = {f"player{i}": rng.randrange(1_000_000) for i in range(keys)}
+    updates = [[(f"player{rng.randrange(keys)}", rng.randrange(1_000_000))
+                for _ in range(int(keys * update_rate))] for _ in range(rounds)]
+
+    plain = dict(scores)
+    t0 = time.perf_counter()
+    for batch in updates:
+        plain.update(batch)
+        expected = list(sorted_dict(plain).items())[:-k - 1:-1]
+    t_resort = (time.perf_counter() - t0) / rounds
+
+    t0 = time.perf_counter()
+    board = SortedValueDict(scores)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for batch in updates:
+        for key, value in batch:
+            board[key] = value
+        got = board.top(k)
+    t_incremental = (time.perf_counter() - t0) / rounds
+
+    print(f"{keys:,} keys, {int(keys * update_rate):,} updates between reads")
+    print(f"  sorted_dict per read  : {t_resort * 1e3:9.1f} ms/round")
+    print(f"  SortedValueDict       : {t_incremental * 1e3:9.1f} ms/round "
+          f"(one-time build {t_build:.2f}s; same top-{k} values: "
+          f"{[v for _, v in got] == [v for _, v in expected]})")
+    key = got[-1][0]
+    t0 = time.perf_counter()
+    rank = board.rank(key)
+    t_rank = time.perf_counter() - t0
+    print(f"  rank({key!r}) = {rank:,} in {t_rank * 1e6:.1f} µs")
+
+
+# Execute:
+if __name__ == "__main__":
+    board = SortedValueDict({'o': 90, 'k': 1, 'gg': 12})
+    print(dict(board.sorted_items()))                # {'k': 1, 'gg': 12, 'o': 90}, like sorted_dict
+    board['k'] = 100
+    del board['gg']
+    board['new'] = 50
+    print(board.top(2))                              # [('k', 100), ('o', 90)]
+    print(board.rank('o'), board.peekitem(0))        # 1 ('new', 50)
+    print(board.value_range(40, 95))                 # [('new', 50), ('o', 90)]
+
+    print("\n⏱️  Benchmark")
+    benchmark()
@@ -0,0 +1,295 @@
+"""
+📊 Word-Frequency Engine
+------------------------
+The word-frequency counter in Dict1.py reads one sentence from `input()`,
+splits it and counts with `dict.get`; Dict2.py's `sorted_dict` then sorts
+every pair to find the most common ones. This module does the same job on
+files of any size:
+
+- exact mode: each worker process counts a byte range of the file with
+  `collections.Counter` (map), and the partial counters are added (reduce)
+- approximate mode, for vocabularies that do not fit in RAM: a Count-Min
+  sketch (a fixed `depth x width` table of counters) plus the `k` heaviest
+  words seen so far. Memory is fixed no matter how many distinct words
+  there are; estimates can only be too high, never too low
+- top-K via `heapq.nlargest`, O(n log k) instead of sorting all n words
+
+Words are whatever `str.split()` returns, exactly like Dict1.py. NumPy is
+imported by the sketch on first use; exact counting never loads it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Mapping, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_SPACES = b" \t\n\r\x0b\x0c"
+
+
+def count_words(text: str) -> Counter:
+    """Dict1.py's word counter, as one C-level `Counter` update."""
+    return Counter(text.split())
+
+
+def top_k(counts: Mapping[str, int], k: int) -> List[Tuple[str, int]]:
+    """The k most frequent words without sorting the whole mapping."""
+    return heapq.nlargest(k, counts.items(), key=lambda item: item[1])
+
+
+# ---------------------------
+# Count-Min sketch
+# ---------------------------
+
+class CountMinSketch:
+    """
+    `depth` rows of `width` counters. A word adds its count to one counter
+    per row; its estimate is the smallest of those counters.
+    Hashing uses blake2b (not `hash()`), so sketches built in different
+    processes agree and can be merged by adding their tables.
+    """
+
+    def __init__(self, width: int = 1 << 20, depth: int = 4) -> None:
+        import numpy as np
+
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+
+    def _columns(self, words: List[str]) -> np.ndarray:
+        """(depth, len(words)) column indices, by double hashing h1 + i * h2."""
+        import numpy as np
+
+        digests = b"".join(hashlib.blake2b(w.encode(), digest_size=8).digest() for w in words)
+        halves = np.frombuffer(digests, dtype="<u4").reshape(-1, 2).astype(np.uint64)
+        h1, h2 = halves[:, 0], halves[:, 1] | 1
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1 + rows * h2) % np.uint64(self.width)).astype(np.int64)
+
+    def add_counts(self, counts: Mapping[str, int]) -> np.ndarray:
+        """Add a batch of counts and return the new estimates of those words (hashing once)."""
+        import numpy as np
+
+        if not counts:
+            return np.zeros(0, dtype=np.int64)
+        columns = self._columns(list(counts))
+        values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], values)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def estimate(self, words: List[str]) -> np.ndarray:
+        import numpy as np
+
+        if not words:
+            return np.zeros(0, dtype=np.int64)
+        columns = self._columns(words)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def merge(self, other: "CountMinSketch") -> None:
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Only sketches of the same shape can be merged.")
+        self.table += other.table
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+
+class HeavyHitters:
+    """
+    Approximate word counts in fixed memory: a Count-Min sketch for every
+    word plus the `k` words with the largest estimates. Offers the same
+    `most_common()` as `Counter`.
+    """
+
+    def __init__(self, k: int = 100, width: int = 1 << 20, depth: int = 4) -> None:
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self.total = 0
+        self._top: dict = {}
+
+    def update(self, counts: Mapping[str, int]) -> None:
+        """Add a batch of exact counts (e.g. one chunk's `Counter`)."""
+        estimates = dict(zip(counts, self.sketch.add_counts(counts).tolist()))
+        self.total += sum(counts.values())
+        self._refresh(estimates)
+
+    def merge(self, other: "HeavyHitters") -> None:
+        self.sketch.merge(other.sketch)
+        self.total += other.total
+        words = list(other._top)
+        self._refresh(dict(zip(words, self.sketch.estimate(words).tolist())))
+
+    def _refresh(self, estimates: dict) -> None:
+        """Keep the k largest of `estimates` and the current top words (re-estimated)."""
+        stale = [w for w in self._top if w not in estimates]
+        estimates.update(zip(stale, self.sketch.estimate(stale).tolist()))
+        self._top = dict(top_k(estimates, self.k))
+
+    def __getitem__(self, word: str) -> int:
+        return int(self.sketch.estimate([word])[0])
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        n = self.k if n is None else min(n, self.k)
+        return top_k(self._top, n)
+
+    @property
+    def nbytes(self) -> int:
+        return self.sketch.nbytes
+
+
+# ---------------------------
+# Files: map / reduce over byte ranges
+# ---------------------------
+
+def _byte_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """Cut a file into ~equal ranges, each boundary just after a whitespace byte."""
+    size = os.path.getsize(path)
+    points = [0]
+    with open(path, "rb") as f:
+        for k in range(1, parts):
+            pos = max(size * k // parts, points[-1])
+            f.seek(pos)
+            while True:
+                block = f.read(1 << 16)
+                hits = [i for i in (block.find(c) for c in _SPACES) if i >= 0]
+                if not block or hits:
+                    pos = pos + min(hits) + 1 if hits else size
+                    break
+                pos += len(block)
+            points.append(pos)
+    points.append(size)
+    return [(a, b) for a, b in zip(points, points[1:]) if b > a]
+
+
+def _read_words(path: str, start: int, stop: int, chunk_size: int) -> Iterator[str]:
+    """Text of a byte range in chunks that end on whitespace (no word is cut)."""
+    carry = b""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            data = f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            data = carry + data
+            cut = max(data.rfind(c) for c in _SPACES) + 1
+            carry = data[cut:]
+            yield data[:cut].decode("utf-8")
+    yield carry.decode("utf-8")
+
+
+def _count_range(path: str, start: int, stop: int, chunk_size: int,
+                 approximate: Optional[Tuple[int, int, int]]) -> Union[Counter, HeavyHitters]:
+    if approximate is None:
+        counts: Counter = Counter()
+        for text in _read_words(path, start, stop, chunk_size):
+            counts.update(text.split())
+        return counts
+    hitters = HeavyHitters(*approximate)
+    for text in _read_words(path, start, stop, chunk_size):
+        hitters.update(count_words(text))
+    return hitters
+
+
+def word_frequency_file(path: str, workers: Optional[int] = None, approximate: bool = False,
+                        k: int = 100, width: int = 1 << 20, depth: int = 4,
+                        chunk_size: int = 1 << 24) -> Union[Counter, HeavyHitters]:
+    """
+    Word counts for a text file.
+
+    approximate=False -> exact `Counter`
+    approximate=True  -> `HeavyHitters` (Count-Min sketch of width x depth,
+                         keeping the top `k`); memory is width * depth * 8 bytes
+    Both answer `.most_common(n)`. `workers` defaults to one per CPU.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else max(workers, 1)
+    sketch_shape = (k, width, depth) if approximate else None
+    ranges = _byte_ranges(path, workers)
+    if workers == 1 or len(ranges) <= 1:
+        return _count_range(path, 0, os.path.getsize(path), chunk_size, sketch_shape)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_count_range, path, a, b, chunk_size, sketch_shape) for a, b in ranges]
+        result = futures[0].result()
+        for future in futures[1:]:
+            part = future.result()
+            if approximate:
+                result.merge(part)
+            else:
+                result.update(part)
+    return result
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(size_mb: int = 200, vocabulary: int = 1_000_000, workers: Optional[int] = None) -> None:
+    """Zipf-distributed corpus: Dict1.py loop + full sort vs. exact and sketch modes."""
+    import tempfile
+    import time
+
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    words = np.array([f"w{i}" for i in range(vocabulary)])
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(fd, "w") as f:
+        written = 0
+        while written < size_mb << 20:
+            ranks = np.minimum(rng.zipf(1.2, 1_000_000), vocabulary) - 1
+            text = " ".join(words[ranks].tolist()) + "\n"
+            f.write(text)
+            written += len(text)
+    try:
+        t0 = time.perf_counter()
+        with open(path) as f:
+            word_frequency = {}
+            for line in f:
+                for word in line.split():
+                    word_frequency[word] = word_frequency.get(word, 0) + 1
+        naive_top = list(dict(sorted(word_frequency.items(), key=lambda item: item[1])).items())[:-11:-1]
+        t_naive = time.perf_counter() - t0
+
+        print(f"{written / 1e6:,.0f} MB corpus, {len(word_frequency):,} distinct words")
+        print(f"  Dict1 loop + sorted_dict : {t_naive:6.2f}s")
+        for n in sorted({1, workers or os.cpu_count() or 1}):
+            t0 = time.perf_counter()
+            exact = word_frequency_file(path, workers=n)
+            elapsed = time.perf_counter() - t0
+            print(f"  exact,  {n:2d} worker(s)     : {elapsed:6.2f}s, "
+                  f"top-10 same: {exact.most_common(10) == naive_top}")
+
+        t0 = time.perf_counter()
+        approx = word_frequency_file(path, workers=workers, approximate=True, k=10, width=1 << 16)
+        elapsed = time.perf_counter() - t0
+        error = max(abs(c - word_frequency[w]) / word_frequency[w] for w, c in approx.most_common(10))
+        print(f"  sketch, {approx.nbytes >> 20} MB table      : {elapsed:6.2f}s, "
+              f"top-10 words same: {[w for w, _ in approx.most_common(10)] == [w for w, _ in naive_top]}, "
+              f"max relative error {error:.2%}")
+    finally:
+        os.remove(path)
+
+
+# Execute:
+if __name__ == "__main__":
+    sentence = "the cat and the hat and the bat"
+    counts = count_words(sentence)
+    print(counts)                                  # Counter({'the': 3, 'and': 2, ...})
+    print(top_k(counts, 2))                        # [('the', 3), ('and', 2)]
+
+    hitters = HeavyHitters(k=2, width=1024)
+    hitters.update(counts)
+    print(hitters.most_common())                   # [('the', 3), ('and', 2)]
+
+    print("\n⏱️  Benchmark")
+    benchmark(size_mb=50)
@@ -0,0 +1,199 @@
+"""
+📦 foundations: the examples as one importable package
+------------------------------------------------------
+The scripts stay where they are (and still run on their own); this
+package gives services one place to import them from:
+
+    from foundations import reverse, is_prime, ShoppingCart
+    import foundations
+    foundations.sorting.external_sort(...)
+
+Nothing is imported up front. A submodule is imported the first time it
+(or one of its exported names) is accessed (PEP 562 `__getattr__`), and
+modules that use NumPy only for some functions import it inside those
+functions, so `import foundations` costs almost nothing and
+`foundations.reverse` never loads NumPy.
+
+Every script is loaded from its file under its own name in this package
+(`foundations.sorting`, `import foundations.rev`, ...); sys.path is left
+alone, so scripts named like PyPI packages (sorting, records, ...) never
+shadow them or get shadowed. The few scripts that other scripts import by
+their flat name (`from primes import is_prime`) are the exception: once
+`foundations` is imported, those names (`SIBLINGS`) resolve to the package
+modules, so both spellings give the same module object.
+
+`python -m benchmarks.importtime` checks the cold import times against a budget.
+"""
+
+import importlib
+import importlib.machinery
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module name: folder (relative to the repository root)
+MODULES = {
+    "alternate_case": ".",
+    "alternate_case_streaming": ".",
+    "letter_frequecny": ".",
+    "letter_frequency_streaming": ".",
+    "rev": ".",
+    "Dict2": ".",
+    "layered_dict": "dict",
+    "profile_patch": "dict",
+    "sorted_value_dict": "dict",
+    "word_frequency": "dict",
+    "Bank_account": "function",
+    "bank_journal": "function",
+    "bank_ledger": "function",
+    "function_examples": "function",
+    "records": "function",
+    "Bubble_sorting": "function/custom_functions",
+    "element_wise_numpy": "function/custom_functions",
+    "elementwise": "function/custom_functions",
+    "prime_nums": "function/custom_functions",
+    "primes": "function/custom_functions",
+    "sorting": "function/custom_functions",
+    "OOP3_Online_Shopping2": "OOP",
+    "async_checkout": "OOP",
+    "columnar_inventory": "OOP",
+    "concurrent_inventory": "OOP",
+    "discount_rules": "OOP",
+    "order_store": "OOP",
+    "persistence": "OOP",
+    "pattern": "playbox",
+    "pyramid": "playbox",
+}
+
+# exported name: module it comes from
+EXPORTS = {
+    "alternate_case": "alternate_case",
+    "alternate_case_file": "alternate_case_streaming",
+    "alternate_case_stream": "alternate_case_streaming",
+    "letter_frequency": "letter_frequecny",
+    "letter_frequency_file": "letter_frequency_streaming",
+    "letter_frequency_stream": "letter_frequency_streaming",
+    "reverse": "rev",
+    "reverse_file": "rev",
+    "reverse_many": "rev",
+    "merging_dictionaries": "Dict2",
+    "sorted_dict": "Dict2",
+    "LayeredDict": "layered_dict",
+    "merge_many": "layered_dict",
+    "ColumnarProfiles": "profile_patch",
+    "apply_patches": "profile_patch",
+    "coalesce": "profile_patch",
+    "SortedValueDict": "sorted_value_dict",
+    "CountMinSketch": "word_frequency",
+    "HeavyHitters": "word_frequency",
+    "count_words": "word_frequency",
+    "top_k": "word_frequency",
+    "word_frequency_file": "word_frequency",
+    "create_account": "Bank_account",
+    "deposit": "Bank_account",
+    "safe_transfer": "Bank_account",
+    "transfer": "Bank_account",
+    "withdraw": "Bank_account",
+    "Journal": "bank_journal",
+    "Ledger": "bank_ledger",
+    "Records": "records",
+    "zip_columns": "records",
+    "fma": "elementwise",
+    "prime_number": "prime_nums",
+    "count_primes": "primes",
+    "is_prime": "primes",
+    "is_prime_many": "primes",
+    "primes_in_range": "primes",
+    "bubble_sort": "sorting",
+    "external_sort": "sorting",
+    "introsort": "sorting",
+    "merge_sort": "sorting",
+    "radix_sort": "sorting",
+    "sort": "sorting",
+    "sort_by_key": "sorting",
+    "Inventory": "OOP3_Online_Shopping2",
+    "Order": "OOP3_Online_Shopping2",
+    "Product": "OOP3_Online_Shopping2",
+    "ShoppingCart": "OOP3_Online_Shopping2",
+    "User": "OOP3_Online_Shopping2",
+    "AsyncPaymentProcessor": "async_checkout",
+    "ColumnarInventory": "columnar_inventory",
+    "ConcurrentInventory": "concurrent_inventory",
+    "CompiledDiscounts": "discount_rules",
+    "DiscountRuleSet": "discount_rules",
+    "OrderStore": "order_store",
+    "ShopStore": "persistence",
+    "render_pattern": "pattern",
+    "write_pattern": "pattern",
+}
+
+__all__ = sorted(EXPORTS)
+
+# Scripts that other scripts import by their flat name (`from primes import is_prime`)
+SIBLINGS = {"OOP3_Online_Shopping2", "alternate_case", "letter_frequecny", "order_store", "pattern", "primes"}
+
+
+def _path(name: str) -> str:
+    return os.path.normpath(os.path.join(ROOT, MODULES[name], name + ".py"))
+
+
+class _SiblingLoader:
+    """Loads a flat sibling name (`primes`) as the package module (`foundations.primes`)."""
+
+    @staticmethod
+    def create_module(spec):
+        return None
+
+    @staticmethod
+    def exec_module(module) -> None:
+        # The import system returns whatever sys.modules holds after exec_module,
+        # so the flat name ends up bound to the package module itself
+        sys.modules[module.__name__] = _import(module.__name__)
+
+
+class _ScriptFinder:
+    """Finds `foundations.<script>` at the script's own path, and the flat `SIBLINGS` names."""
+
+    @staticmethod
+    def find_spec(fullname, path=None, target=None):
+        package, _, name = fullname.rpartition(".")
+        if not package and name in SIBLINGS:
+            return importlib.machinery.ModuleSpec(fullname, _SiblingLoader)
+        if package != __name__ or name not in MODULES:
+            return None
+        # What importlib.util.spec_from_file_location builds, without importing importlib.util (~7 ms)
+        loader = importlib.machinery.SourceFileLoader(fullname, _path(name))
+        spec = importlib.machinery.ModuleSpec(fullname, loader, origin=_path(name))
+        spec.has_location = True
+        return spec
+
+
+# First, so a script's siblings never come from the working directory or an installed package
+if not any(isinstance(finder, _ScriptFinder) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _ScriptFinder())
+
+
+def _import(name: str):
+    """The script `name`, loaded as `foundations.<name>`."""
+    module = importlib.import_module(f"{__name__}.{name}")
+    if name in EXPORTS:
+        # Importing set foundations.<name> to the module; the exported name wins
+        globals()[name] = getattr(module if EXPORTS[name] == name else _import(EXPORTS[name]), name)
+    return module
+
+
+def __getattr__(name: str):
+    # Exported names win over module names: foundations.alternate_case is the function
+    if name in EXPORTS:
+        value = getattr(_import(EXPORTS[name]), name)
+    elif name in MODULES:
+        value = _import(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value            # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(MODULES) | set(EXPORTS))
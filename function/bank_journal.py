@@ -0,0 +1,334 @@
+"""
+📒 Event-sourced Bank Journal
+-----------------------------
+Bank_account.py changes `account["balance"]` in place and forgets how it got
+there, so "what was Alice's balance last Friday?" cannot be answered, and a
+crash loses everything.
+
+Event sourcing keeps the history instead:
+
+- every deposit/withdrawal is appended to a journal file as a fixed-size
+  binary record (20 bytes: time, account row, signed amount)
+- every `checkpoint_every` events, all current balances are saved as a
+  checkpoint (one .npy array)
+- the balance at time T = the balance in the last checkpoint before T
+  plus the journaled amounts between that checkpoint and T
+
+Because records have a fixed size, the journal is read through a NumPy
+memory map: a query only touches the pages between one checkpoint and T,
+so memory stays bounded no matter how long the journal grows.
+
+Directory layout:
+
+    accounts.tsv        account number <TAB> holder (line number = row)
+    journal.bin         event records, in time order
+    checkpoints.idx     (event count, time) per checkpoint
+    ckpt-<count>.npy    balances after the first <count> events
+"""
+
+import os
+import struct
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+import numpy as np
+
+EVENT = np.dtype([("time", "<f8"), ("account", "<u4"), ("amount", "<i8")])  # packed: 20 bytes
+_CHECKPOINT = struct.Struct("<qd")
+
+
+class Journal:
+    """Append-only journal of account events with periodic balance checkpoints."""
+
+    def __init__(self, directory: str, checkpoint_every: int = 1_000_000, buffer_size: int = 65_536) -> None:
+        self.directory = directory
+        self.checkpoint_every = checkpoint_every
+        os.makedirs(directory, exist_ok=True)
+
+        self._index: Dict[str, int] = {}
+        self._holders: List[str] = []
+        self._checkpoints: List[int] = []        # event counts
+        self._checkpoint_times: List[float] = []
+        self._buffer = np.zeros(buffer_size, dtype=EVENT)
+        self._buffered = 0
+        self._last_time = float("-inf")
+        self._recover()
+        self._journal = open(self._path("journal.bin"), "ab")
+        self._accounts_file = open(self._path("accounts.tsv"), "a", encoding="utf-8")
+        self._checkpoint_file = open(self._path("checkpoints.idx"), "ab")
+
+    # -----------------------------
+    # Writing events
+    # -----------------------------
+    def create_account(self, account_number: str, account_holder: str, balance: int = 0) -> int:
+        if account_number in self._index:
+            raise ValueError(f"Account {account_number} already exists.")
+        if "\t" in account_number or "\n" in account_number or "\t" in account_holder or "\n" in account_holder:
+            raise ValueError("Account number and holder cannot contain tabs or newlines.")
+        if balance < 0:
+            raise ValueError("Opening balance cannot be negative.")   # before anything is registered
+        row = len(self._holders)
+        self._index[account_number] = row
+        self._holders.append(account_holder)
+        if row == len(self._balances):
+            self._balances = np.concatenate((self._balances, np.zeros(max(row, 16), dtype=np.int64)))
+        self._accounts_file.write(f"{account_number}\t{account_holder}\n")
+        self._accounts_file.flush()
+        if balance:
+            self.deposit(account_number, balance)
+        return row
+
+    def deposit(self, account_number: str, amount: int, at: Optional[float] = None) -> None:
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive.")
+        self._append(self._index[account_number], amount, at)
+
+    def withdraw(self, account_number: str, amount: int, at: Optional[float] = None) -> bool:
+        """Journal a withdrawal; returns False (and journals nothing) on insufficient funds."""
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive.")
+        row = self._index[account_number]
+        if self._balances[row] < amount:
+            return False
+        self._append(row, -amount, at)
+        return True
+
+    def transfer(self, source: str, target: str, amount: int, at: Optional[float] = None) -> bool:
+        at = time.time() if at is None else at
+        if not self.withdraw(source, amount, at):
+            return False
+        self.deposit(target, amount, at)
+        return True
+
+    def record_batch(self, accounts, amounts, times) -> None:
+        """
+        Append many already-validated events at once (e.g. the accepted
+        transactions of a `bank_ledger.Ledger` batch). `times` must not decrease.
+        """
+        accounts = np.asarray(accounts, dtype=np.uint32)
+        amounts = np.asarray(amounts, dtype=np.int64)
+        times = np.asarray(times, dtype=np.float64)
+        if not (len(accounts) == len(amounts) == len(times)):
+            raise ValueError("All columns must have the same length.")
+        if len(times) == 0:
+            return
+        if times[0] < self._last_time or (np.diff(times) < 0).any():
+            raise ValueError("Event times must not decrease.")
+        if accounts.max() >= len(self._holders):
+            raise IndexError("Account row out of range.")
+        self._flush_buffer()
+        events = np.empty(len(accounts), dtype=EVENT)
+        events["time"], events["account"], events["amount"] = times, accounts, amounts
+        self._write(events)
+
+    def flush(self, fsync: bool = False) -> None:
+        self._flush_buffer()
+        self._journal.flush()
+        if fsync:
+            os.fsync(self._journal.fileno())
+
+    def close(self) -> None:
+        self.flush(fsync=True)
+        self._journal.close()
+        self._accounts_file.close()
+        self._checkpoint_file.close()
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def balance(self, account_number: str) -> int:
+        return int(self._balances[self._index[account_number]])
+
+    def balance_at(self, account_number: str, at: float) -> int:
+        """Balance of an account right after all events with time <= `at`."""
+        row = self._index[account_number]
+        self.flush()
+        k = bisect_right(self._checkpoint_times, at)
+        if k:
+            start = self._checkpoints[k - 1]
+            saved = np.load(self._checkpoint_path(start), mmap_mode="r")
+            balance = int(saved[row]) if row < len(saved) else 0   # account may be newer
+        else:
+            start, balance = 0, 0
+        stop = self._checkpoints[k] if k < len(self._checkpoints) else self._events
+        if stop > start:
+            events = np.memmap(self._path("journal.bin"), dtype=EVENT, mode="r")[start:stop]
+            end = int(np.searchsorted(events["time"], at, side="right"))
+            events = events[:end]
+            balance += int(events["amount"][events["account"] == row].sum())
+        return balance
+
+    def __len__(self) -> int:
+        return self._events
+
+    # -----------------------------
+    # Internals
+    # -----------------------------
+    def _append(self, row: int, amount: int, at: Optional[float]) -> None:
+        at = time.time() if at is None else at
+        if at < self._last_time:
+            raise ValueError("Event times must not decrease.")
+        self._last_time = at
+        self._balances[row] += amount
+        self._buffer[self._buffered] = (at, row, amount)
+        self._buffered += 1
+        if self._buffered == len(self._buffer):
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        if self._buffered:
+            events = self._buffer[:self._buffered].copy()
+            self._buffered = 0
+            # _append already applied these to the balances
+            self._write(events, applied=True)
+
+    def _write(self, events: np.ndarray, applied: bool = False) -> None:
+        if not applied:
+            np.add.at(self._balances, events["account"], events["amount"])
+        self._journal.write(events.tobytes())
+        self._events += len(events)
+        self._last_time = float(events["time"][-1])
+        last = self._checkpoints[-1] if self._checkpoints else 0
+        if self._events - last >= self.checkpoint_every:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        self._journal.flush()
+        os.fsync(self._journal.fileno())        # never let a checkpoint get ahead of the journal
+        path = self._checkpoint_path(self._events)
+        with open(path + ".tmp", "wb") as f:
+            np.save(f, self._balances[:len(self._holders)])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        self._checkpoint_file.write(_CHECKPOINT.pack(self._events, self._last_time))
+        self._checkpoint_file.flush()
+        self._checkpoints.append(self._events)
+        self._checkpoint_times.append(self._last_time)
+
+    def _recover(self) -> None:
+        """Rebuild accounts and current balances: last checkpoint + journal tail."""
+        accounts = self._path("accounts.tsv")
+        if os.path.exists(accounts):
+            with open(accounts, encoding="utf-8") as f:
+                for line in f:
+                    if line.endswith("\n"):
+                        number, holder = line[:-1].split("\t")
+                        self._index[number] = len(self._holders)
+                        self._holders.append(holder)
+        self._balances = np.zeros(len(self._holders), dtype=np.int64)
+
+        journal = self._path("journal.bin")
+        size = os.path.getsize(journal) if os.path.exists(journal) else 0
+        if size % EVENT.itemsize:                # torn last record after a crash
+            size -= size % EVENT.itemsize
+            os.truncate(journal, size)
+        self._events = size // EVENT.itemsize
+
+        index = self._path("checkpoints.idx")
+        if os.path.exists(index):
+            with open(index, "rb") as f:
+                data = f.read()
+            for count, at in _CHECKPOINT.iter_unpack(data[:len(data) - len(data) % _CHECKPOINT.size]):
+                if count <= self._events and os.path.exists(self._checkpoint_path(count)):
+                    self._checkpoints.append(count)
+                    self._checkpoint_times.append(at)
+
+        start = 0
+        if self._checkpoints:
+            start = self._checkpoints[-1]
+            saved = np.load(self._checkpoint_path(start))
+            self._balances[:len(saved)] = saved
+        if self._events > start:
+            events = np.memmap(journal, dtype=EVENT, mode="r")
+            for lo in range(start, self._events, self.checkpoint_every):
+                chunk = events[lo:min(lo + self.checkpoint_every, self._events)]
+                np.add.at(self._balances, chunk["account"], chunk["amount"])
+            self._last_time = float(events["time"][self._events - 1])
+            del events
+
+    def _checkpoint_path(self, count: int) -> str:
+        return self._path(f"ckpt-{count}.npy")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+
+# -----------------------------
+# Benchmark
+# -----------------------------
+def benchmark(events: int = 100_000_000, accounts: int = 100_000, batch: int = 1_000_000,
+              checkpoint_every: int = 5_000_000) -> None:
+    """Journal `events` events in batches, then time point-in-time queries and recovery."""
+    import random
+    import resource
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp(prefix="bank-journal-")
+    try:
+        journal = Journal(directory, checkpoint_every=checkpoint_every)
+        for i in range(accounts):
+            journal.create_account(f"{i:08d}", f"Holder {i}")
+        rng = np.random.default_rng(0)
+        t0 = time.perf_counter()
+        clock = 0.0
+        for start in range(0, events, batch):
+            n = min(batch, events - start)
+            times = clock + np.arange(n, dtype=np.float64)
+            clock += n
+            journal.record_batch(rng.integers(0, accounts, n), rng.integers(1, 1_000, n), times)
+        journal.flush(fsync=True)
+        t_write = time.perf_counter() - t0
+
+        picks = random.Random(1)
+        t0 = time.perf_counter()
+        queries = 100
+        for _ in range(queries):
+            journal.balance_at(f"{picks.randrange(accounts):08d}", picks.uniform(0, clock))
+        t_query = (time.perf_counter() - t0) / queries
+        journal.close()
+
+        t0 = time.perf_counter()
+        Journal(directory, checkpoint_every=checkpoint_every).close()
+        t_recover = time.perf_counter() - t0
+
+        peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{events:,} events, {accounts:,} accounts, checkpoint every {checkpoint_every:,}")
+        print(f"  write     : {t_write:7.2f}s ({events / t_write:12,.0f} events/s), "
+              f"{os.path.getsize(os.path.join(directory, 'journal.bin')) / 2**30:.2f} GiB")
+        print(f"  balance_at: {t_query * 1e3:7.2f} ms per query")
+        print(f"  recovery  : {t_recover:7.2f}s")
+        print(f"  peak RSS  : {peak_mib:7.0f} MiB")
+    finally:
+        shutil.rmtree(directory)
+
+
+# -----------------------------
+# Main Demo
+# -----------------------------
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp(prefix="bank-journal-")
+    journal = Journal(directory, checkpoint_every=2)
+    journal.create_account("123456", "Alice", 1000)           # t=... (now)
+    journal.create_account("789012", "Bob", 500)
+    journal.deposit("123456", 200, at=time.time() + 10)
+    monday = time.time() + 20
+    journal.withdraw("123456", 100, at=monday)
+    journal.transfer("123456", "789012", 300, at=monday + 10)
+    journal.close()
+
+    # Restart: state is rebuilt from the last checkpoint + journal tail
+    journal = Journal(directory, checkpoint_every=2)
+    print("Alice now      :", journal.balance("123456"))          # 800
+    print("Alice at monday:", journal.balance_at("123456", monday))  # 1100
+    print("Bob at monday  :", journal.balance_at("789012", monday))  # 500
+    journal.close()
+    shutil.rmtree(directory)
+
+    print("\n⏱️  Benchmark")
+    benchmark(events=10_000_000, checkpoint_every=1_000_000)
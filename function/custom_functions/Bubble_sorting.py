@@ -1,5 +1,4 @@
 # Bubble sorting
-arr = [7, 3, 9, 2, 0, 4, 8, 1, 6, 5]
 def bubble_sort(seq):
     n = len(seq)
     for i in range(n-1):
@@ -10,4 +9,7 @@ def bubble_sort(seq):
                 seq[j+1] = temp
     return seq
 
-print(bubble_sort(arr))
\ No newline at end of file
+# Execute:
+if __name__ == "__main__":
+    arr = [7, 3, 9, 2, 0, 4, 8, 1, 6, 5]
+    print(bubble_sort(arr))
\ No newline at end of file
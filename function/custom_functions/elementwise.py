@@ -0,0 +1,226 @@
+"""
+✖️ Streaming Element-wise Kernels
+---------------------------------
+`funcy()` in element_wise_numpy.py does `np.multiply(arr1, arr2)`: both
+inputs and the full result live in RAM, and `a * b + c` would add one more
+full-size temporary per operator.
+
+Here every operation runs chunk by chunk with the ufunc's `out=` argument:
+
+- inputs can be arrays, `np.memmap` files or scalars
+- the result goes to a new array, to an existing array/memmap (`out=`),
+  or in place into the first input (`out="inplace"`)
+- extra memory is one chunk (for `fma`, or when `out` is also an input),
+  independent of the array size; array inputs must be C-contiguous, since
+  flattening anything else would copy it whole
+- `threads` > 1 splits the chunks over a thread pool; NumPy releases the
+  GIL inside ufuncs, so chunks really run in parallel
+- `stream(op, *iterators)` does the same for inputs that arrive as
+  iterators of chunks
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+CHUNK = 1 << 18          # elements per chunk: 2 MB of float64, stays in cache
+
+
+def _fma(a, b, c, out=None):
+    """out = a * b + c without a temporary (out must not be c)."""
+    out = np.multiply(a, b, out=out)
+    return np.add(out, c, out=out)
+
+
+KERNELS = {
+    "multiply": np.multiply,
+    "add": np.add,
+    "subtract": np.subtract,
+    "divide": np.divide,
+    "maximum": np.maximum,
+    "minimum": np.minimum,
+    "fma": _fma,
+}
+
+Operand = Union[np.ndarray, float, int]
+
+
+def _kernel(op: Union[str, Callable]) -> Callable:
+    return KERNELS[op] if isinstance(op, str) else op
+
+
+def _flat(x: Operand) -> Operand:
+    return x.reshape(-1) if isinstance(x, np.ndarray) else x
+
+
+def _part(x: Operand, lo: int, hi: int) -> Operand:
+    return x[lo:hi] if isinstance(x, np.ndarray) else x
+
+
+def _out_dtype(kernel: Callable, inputs) -> np.dtype:
+    """The dtype the kernel itself produces (e.g. float64 for int / int), from a zero-length call."""
+    return kernel(*(x.reshape(-1)[:0] if isinstance(x, np.ndarray) else x for x in inputs)).dtype
+
+
+def _same_memory(x: np.ndarray, out: np.ndarray) -> bool:
+    """x and out are the very same elements (not just overlapping ones)."""
+    return (x.__array_interface__["data"][0] == out.__array_interface__["data"][0]
+            and x.shape == out.shape and x.strides == out.strides)
+
+
+def open_memmap(path: str, shape, dtype=np.float64, mode: str = "w+") -> np.memmap:
+    """Memory-mapped output (or input, with mode="r") file."""
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+
+def apply(op: Union[str, Callable], *inputs: Operand, out: Union[np.ndarray, str, None] = None,
+          chunk: int = CHUNK, threads: int = 1) -> np.ndarray:
+    """
+    Run an element-wise kernel (a name from KERNELS or any `f(*inputs, out=...)`)
+    chunk by chunk. Array inputs must all have the same shape.
+    """
+    kernel = _kernel(op)
+    arrays = [x for x in inputs if isinstance(x, np.ndarray)]
+    if not arrays:
+        raise ValueError("At least one input must be an array.")
+    shape = arrays[0].shape
+    if any(a.shape != shape for a in arrays):
+        raise ValueError("Array inputs must have the same shape.")
+    if not all(a.flags.c_contiguous for a in arrays):
+        raise ValueError("Array inputs must be C-contiguous (use np.ascontiguousarray).")
+    if isinstance(out, str):
+        if out != "inplace" or not isinstance(inputs[0], np.ndarray):
+            raise ValueError('out="inplace" needs an array as the first input.')
+        out = inputs[0]
+    elif out is None:
+        out = np.empty(shape, dtype=_out_dtype(kernel, inputs))
+    elif out.shape != shape:
+        raise ValueError("Output shape does not match the inputs.")
+    if not out.flags.c_contiguous:
+        raise ValueError("Output must be C-contiguous.")
+
+    overlapping = [x for x in arrays if np.shares_memory(x, out)]
+    if any(not _same_memory(x, out) for x in overlapping):
+        # chunk k would overwrite values chunk k + 1 still has to read
+        raise ValueError("out partially overlaps an input.")
+    # When out is also an input, a kernel such as fma would read that input
+    # after writing out; compute each chunk into a temporary first (plain
+    # ufuncs handle out-is-input themselves).
+    buffered = bool(overlapping) and not isinstance(kernel, np.ufunc)
+
+    flat_in = [_flat(x) for x in inputs]
+    flat_out = out.reshape(-1)                  # a view, since out is contiguous
+
+    def run(lo: int) -> None:
+        hi = min(lo + chunk, flat_out.size)
+        parts = [_part(x, lo, hi) for x in flat_in]
+        if buffered:
+            flat_out[lo:hi] = kernel(*parts)
+        else:
+            kernel(*parts, out=flat_out[lo:hi])
+
+    starts = range(0, flat_out.size, chunk)
+    if threads <= 1:
+        for lo in starts:
+            run(lo)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(run, starts))
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def multiply(a: Operand, b: Operand, **kwargs) -> np.ndarray:
+    return apply("multiply", a, b, **kwargs)
+
+
+def add(a: Operand, b: Operand, **kwargs) -> np.ndarray:
+    return apply("add", a, b, **kwargs)
+
+
+def fma(a: Operand, b: Operand, c: Operand, **kwargs) -> np.ndarray:
+    """a * b + c (fused in the sense of one pass and no temporaries)."""
+    return apply("fma", a, b, c, **kwargs)
+
+
+def stream(op: Union[str, Callable], *sources: Iterable[Operand],
+           out: Optional[np.ndarray] = None) -> Iterator[np.ndarray]:
+    """
+    Element-wise kernel over inputs that arrive as iterators of chunks
+    (all yielding chunks of matching lengths). Yields each result chunk;
+    if `out` is given, results are also written into it one after another.
+    """
+    kernel = _kernel(op)
+    pos = 0
+    for parts in zip(*sources):
+        n = max(len(p) for p in parts if isinstance(p, np.ndarray))
+        target = out[pos:pos + n] if out is not None else np.empty(n, dtype=_out_dtype(kernel, parts))
+        kernel(*parts, out=target)
+        pos += n
+        yield target
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def benchmark(size_mb: int = 1024, threads: Optional[int] = None) -> None:
+    """fma over float64 memmap files of `size_mb` each: GB/s and extra memory."""
+    import tempfile
+    import time
+    import tracemalloc
+
+    threads = threads or os.cpu_count() or 1
+    n = size_mb * (1 << 20) // 8
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"{name}.bin") for name in "abc"]
+        for k, path in enumerate(paths):
+            m = open_memmap(path, (n,))
+            m.fill(k + 1.5)
+            m.flush()
+            del m
+        a, b, c = (open_memmap(p, (n,), mode="r") for p in paths)
+        moved = 4 * n * 8                                     # 3 inputs read + 1 output written
+
+        for t in sorted({1, threads}):
+            out = open_memmap(os.path.join(tmp, "out.bin"), (n,))
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            fma(a, b, c, out=out, threads=t)
+            elapsed = time.perf_counter() - t0
+            extra = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            ok = out[0] == 1.5 * 2.5 + 3.5 and out[-1] == 1.5 * 2.5 + 3.5
+            print(f"fma on {size_mb} MB memmaps, {t} thread(s): {moved / elapsed / 1e9:5.2f} GB/s, "
+                  f"peak extra memory {extra / 2 ** 20:5.1f} MB (correct: {ok})")
+            del out
+
+        small = min(n, 1 << 25)
+        x, y, z = (np.asarray(m[:small]) for m in (a, b, c))
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        x * y + z
+        elapsed = time.perf_counter() - t0
+        extra = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"plain x * y + z on {small * 8 >> 20} MB in RAM : {4 * small * 8 / elapsed / 1e9:5.2f} GB/s, "
+              f"peak extra memory {extra / 2 ** 20:5.1f} MB")
+        del a, b, c, x, y, z
+
+
+# Execute:
+if __name__ == "__main__":
+    arr1 = np.array([1.0, 2.0, 3.0])
+    arr2 = np.array([4.0, 5.0, 6.0])
+    print(multiply(arr1, arr2))                          # [ 4. 10. 18.]
+    print(fma(arr1, arr2, 1.0))                          # [ 5. 11. 19.]
+    add(arr1, arr2, out="inplace")
+    print(arr1)                                          # [5. 7. 9.]
+    chunks = stream("multiply", iter([arr2[:2], arr2[2:]]), iter([2.0, 3.0]))
+    print([c.tolist() for c in chunks])                  # [[8.0, 10.0], [18.0]]
+
+    print("\n⏱️  Benchmark")
+    benchmark()
@@ -1,15 +1,19 @@
 # find a prime number: prime number fuction
+# (bulk work - ranges of primes, whole arrays - lives in primes.py)
+from primes import is_prime
+
+
 def prime_number(n):
-    n = int(input("Enter a number: "))
-    if n < 1:
+    if n < 2:
         print("Enter a number greater than one!")
-    else:
-        for i in range(2, n):
-            if n % 2 == 0:
-                print("Not a prime number")
-                break
-        else:
-            print("'Is a prime number'")
-
-prime = prime_number(8)
-prime_number(prime)
\ No newline at end of file
+        return False
+    if is_prime(n):
+        print("'Is a prime number'")
+        return True
+    print("Not a prime number")
+    return False
+
+
+if __name__ == "__main__":
+    n = int(input("Enter a number: "))
+    prime_number(n)
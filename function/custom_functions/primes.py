@@ -0,0 +1,223 @@
+"""
+🔢 Prime Engine
+---------------
+prime_nums.py tests one number by trial division. This module covers the
+bulk cases:
+
+- `primes_in_range(start, stop)`: segmented Sieve of Eratosthenes. Only odd
+  numbers are stored (one byte each) and only one segment is in memory at a
+  time, so enumerating primes up to 10**10 needs a few MB. Segments are
+  yielded lazily as NumPy arrays and can be sieved on several processes
+- `is_prime(n)`: deterministic Miller-Rabin, exact for every 64-bit n
+  (bases 2..37 are enough below 3.3 * 10**24)
+- `is_prime_many(values)`: a whole array at once; small values come from a
+  sieve lookup table, the rest are filtered by small primes with NumPy and
+  only the survivors go through Miller-Rabin
+
+NumPy and the process pool are imported on first use; `is_prime` needs neither.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_TABLE_LIMIT = 1 << 24      # is_prime_many uses a lookup table up to here
+
+
+def simple_sieve(limit: int) -> np.ndarray:
+    """All primes < limit (plain odd-only sieve, used for the base primes)."""
+    import numpy as np
+    if limit <= 2:
+        return np.zeros(0, dtype=np.int64)
+    odd = np.ones(limit // 2, dtype=bool)           # odd[i] <=> 2*i + 1
+    odd[0] = False
+    for i in range(1, (math.isqrt(limit - 1) - 1) // 2 + 1):
+        if odd[i]:
+            p = 2 * i + 1
+            odd[p * p // 2::p] = False
+    return np.concatenate(([2], 2 * np.flatnonzero(odd) + 1)).astype(np.int64)
+
+
+def _sieve_segment(lo: int, hi: int, base: np.ndarray) -> np.ndarray:
+    """Primes in [lo, hi), given every odd prime up to sqrt(hi) in `base`."""
+    import numpy as np
+    lo_odd = lo | 1
+    if hi <= lo_odd:
+        return np.array([2], dtype=np.int64) if lo <= 2 < hi else np.zeros(0, dtype=np.int64)
+    odd = np.ones((hi - lo_odd + 1) // 2, dtype=bool)   # odd[i] <=> lo_odd + 2*i
+    for p in base[:np.searchsorted(base, math.isqrt(hi - 1), side="right")].tolist():
+        first = max(p * p, (lo_odd + p - 1) // p * p)
+        if first % 2 == 0:
+            first += p
+        odd[(first - lo_odd) // 2::p] = False
+    result = lo_odd + 2 * np.flatnonzero(odd).astype(np.int64)
+    if lo <= 1 < hi:
+        result = result[1:]                         # 1 is not prime
+    if lo <= 2 < hi:
+        result = np.concatenate(([2], result))
+    return result
+
+
+def primes_in_range(start: int, stop: int, segment_size: int = 1 << 24,
+                    workers: int = 1) -> Iterator[np.ndarray]:
+    """
+    Primes in [start, stop) as a stream of sorted NumPy arrays (one per
+    segment of `segment_size` numbers). With `workers` > 1 segments are
+    sieved on a process pool; at most 2 * workers finished segments wait
+    in memory.
+    """
+    start = max(start, 0)
+    if stop <= start:
+        return
+    base = simple_sieve(math.isqrt(stop - 1) + 1)[1:]   # odd base primes
+    bounds = [(lo, min(lo + segment_size, stop)) for lo in range(start, stop, segment_size)]
+    if workers <= 1:
+        for lo, hi in bounds:
+            yield _sieve_segment(lo, hi, base)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        segments = iter(bounds)
+        for lo, hi in segments:
+            pending.append(pool.submit(_sieve_segment, lo, hi, base))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            primes = pending.popleft().result()
+            nxt = next(segments, None)
+            if nxt is not None:
+                pending.append(pool.submit(_sieve_segment, *nxt, base))
+            yield primes
+
+
+def count_primes(start: int, stop: int, segment_size: int = 1 << 24, workers: int = 1) -> int:
+    return sum(len(seg) for seg in primes_in_range(start, stop, segment_size, workers))
+
+
+def is_prime(n: int) -> bool:
+    """Deterministic Miller-Rabin for 64-bit (and somewhat larger) integers."""
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+_table: Optional[np.ndarray] = None
+
+
+def _lookup_table() -> np.ndarray:
+    global _table
+    if _table is None:
+        import numpy as np
+        _table = np.zeros(_TABLE_LIMIT, dtype=bool)
+        _table[simple_sieve(_TABLE_LIMIT)] = True
+    return _table
+
+
+def is_prime_many(values: Iterable[int]) -> np.ndarray:
+    """Boolean array: which of `values` (non-negative, < 2**64) are prime."""
+    import numpy as np
+    values = np.asarray(values, dtype=np.uint64)
+    result = np.zeros(values.shape, dtype=bool)
+    small = values < _TABLE_LIMIT
+    if small.any():
+        result[small] = _lookup_table()[values[small].astype(np.int64)]
+
+    large = np.flatnonzero(~small)
+    if len(large):
+        candidates = values.ravel()[large]
+        for p in simple_sieve(1000).tolist():       # cheap vectorized pre-filter
+            keep = candidates % np.uint64(p) != 0
+            candidates, large = candidates[keep], large[keep]
+        result.ravel()[large] = [is_prime(n) for n in candidates.tolist()]
+    return result
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+def _trial_division(n: int) -> bool:
+    """Reference: correct trial division up to sqrt(n)."""
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    for i in range(3, math.isqrt(n) + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+
+def benchmark(limit: int = 10 ** 8, workers: Optional[int] = None) -> None:
+    import time
+
+    import numpy as np
+
+    workers = workers or os.cpu_count() or 1
+    small = 10 ** 6
+    t0 = time.perf_counter()
+    expected = sum(_trial_division(n) for n in range(small))
+    t_trial = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    got = count_primes(0, small)
+    t_sieve = time.perf_counter() - t0
+    print(f"primes below {small:,}: trial division {t_trial:7.3f}s, sieve {t_sieve:7.3f}s "
+          f"(same count: {got == expected})")
+
+    for n in sorted({1, workers}):
+        t0 = time.perf_counter()
+        count = count_primes(0, limit, workers=n)
+        print(f"primes below {limit:,}: {count:,} in {time.perf_counter() - t0:6.2f}s with {n} worker(s)")
+
+    big = [10 ** 12 + 39, 10 ** 12 + 61, 10 ** 12 + 63]
+    t0 = time.perf_counter()
+    trial = [_trial_division(n) for n in big]
+    t_trial = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    mr = [is_prime(n) for n in big]
+    t_mr = time.perf_counter() - t0
+    print(f"is_prime on {len(big)} numbers ~10**12+: trial {t_trial * 1e3:9.2f} ms, "
+          f"Miller-Rabin {t_mr * 1e3:6.3f} ms (same: {trial == mr})")
+
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 2 ** 63, 1_000_000, dtype=np.uint64)
+    t0 = time.perf_counter()
+    flags = is_prime_many(values)
+    print(f"is_prime_many on 1,000,000 random 63-bit values: {time.perf_counter() - t0:6.2f}s "
+          f"({flags.sum():,} primes)")
+
+
+# Execute:
+if __name__ == "__main__":
+    print(next(primes_in_range(0, 50)).tolist())           # [2, 3, 5, 7, ..., 47]
+    print(is_prime(2 ** 61 - 1), is_prime(2 ** 61 + 1))     # True False
+    print(is_prime_many([1, 2, 8, 97, 2 ** 61 - 1]).tolist())
+
+    print("\n⏱️  Benchmark")
+    benchmark()
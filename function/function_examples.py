@@ -3,10 +3,11 @@
 def greet(name):
     return f"Hello, {name}!"
 
-print(greet("Alice"))
-
 def add(a, b=10):
     return a + b
 
-print("Add with default:", add(5))
-print("Add with both:", add(5, 3))
+# Execute:
+if __name__ == "__main__":
+    print(greet("Alice"))
+    print("Add with default:", add(5))
+    print("Add with both:", add(5, 3))
@@ -0,0 +1,206 @@
+"""
+🗃️ Columnar zip / unzip
+-----------------------
+zip.py builds `list(zip(names, rarity, weights))`, one tuple per item, and
+unzips with `zip(*inventory)`, which passes every tuple as an argument and
+copies everything again. Fine for three swords, not for ten million rows.
+
+`Records` keeps the data the other way round, as named columns
+(struct of arrays):
+
+- zipping stores the columns as they are; no per-row tuple is built
+- `records[i]` is a lazy `Row` view that reads the columns when asked
+- `unzip()` hands back the stored columns: O(1), nothing is copied
+- `Records` is a container, not an iterator, so it can be looped over any
+  number of times (the "zip() can only be consumed once" pitfall)
+- `compact=True` stores numeric columns as NumPy arrays (8 bytes per value
+  instead of a pointer plus a Python object)
+- columns are also attributes (`records.names`, `row.names`), so a column
+  may not be named like a method (`unzip`, `count`, `as_tuple`, ...)
+
+NumPy is only imported when `compact=True` is used.
+"""
+
+import sys
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, Tuple
+
+
+class Row:
+    """One row of a Records table; reads its values from the columns on access."""
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records: "Records", index: int) -> None:
+        self._records = records
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._records._columns[name][self._index]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key) -> Any:
+        columns = self._records._columns
+        column = columns[key] if isinstance(key, str) else list(columns.values())[key]
+        return column[self._index]
+
+    def as_tuple(self) -> tuple:
+        return tuple(column[self._index] for column in self._records._columns.values())
+
+    def __iter__(self) -> Iterator:
+        return iter(self.as_tuple())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Row):
+            other = other.as_tuple()
+        return self.as_tuple() == other
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={column[self._index]!r}"
+                           for name, column in self._records._columns.items())
+        return f"Row({fields})"
+
+
+class Records(Sequence):
+    """Named, equally long columns that behave like a sequence of rows."""
+
+    def __init__(self, compact: bool = False, **columns: Sequence) -> None:
+        clashes = sorted(name for name in columns if name in _RESERVED)
+        if clashes:
+            raise ValueError(f"Column names clash with Records/Row attributes: {clashes}")
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self._length = lengths.pop() if lengths else 0
+        self._columns: Dict[str, Sequence] = {
+            name: _compact(column) if compact else column for name, column in columns.items()
+        }
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Column names, in order."""
+        return tuple(self._columns)
+
+    def column(self, name: str) -> Sequence:
+        return self._columns[name]
+
+    def __getattr__(self, name: str) -> Sequence:
+        columns = self.__dict__.get("_columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def unzip(self) -> Tuple[Sequence, ...]:
+        """The columns themselves, in order (no copy)."""
+        return tuple(self._columns.values())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Slices of NumPy columns are views; list slices copy only that range
+            return Records(**{name: column[index] for name, column in self._columns.items()})
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Records index out of range")
+        return Row(self, index)
+
+    def __iter__(self) -> Iterator[Row]:
+        return (Row(self, i) for i in range(self._length))
+
+    def tuples(self) -> Iterator[tuple]:
+        """Rows as plain tuples, built lazily (like iterating over zip())."""
+        return zip(*self._columns.values())
+
+    def __repr__(self) -> str:
+        return f"Records({self._length} rows, columns={list(self._columns)})"
+
+
+# Column names that would shadow, or be hidden by, an attribute of Records or Row
+_RESERVED = frozenset(dir(Records)) | frozenset(dir(Row))
+
+
+def _compact(column: Sequence) -> Sequence:
+    """Numeric lists become NumPy arrays; anything else is kept as is."""
+    loaded = sys.modules.get("numpy")          # without NumPy loaded, column cannot be an array
+    if loaded is not None and isinstance(column, loaded.ndarray) \
+            or not len(column) or not isinstance(column[0], (int, float)):
+        return column
+    import numpy as np
+    array = np.asarray(column)
+    return array if array.dtype.kind in "biuf" else column
+
+
+def zip_columns(compact: bool = False, **columns: Sequence) -> Records:
+    """`zip()` for named columns, e.g. zip_columns(names=..., rarity=..., weights=...)."""
+    return Records(compact=compact, **columns)
+
+
+# ------------------------------------
+# Benchmark
+# ------------------------------------
+def benchmark(rows: int = 10_000_000) -> None:
+    """Memory and time of list(zip()) + zip(*) vs Records, for `rows` rows."""
+    import gc
+    import time
+    import tracemalloc
+
+    kinds = ['Sword', 'Wooden Shield', 'Metal']
+    item_names = [kinds[i % 3] for i in range(rows)]
+    item_rarity = [i % 100 for i in range(rows)]
+    item_weights = [float(i % 1000) / 10 for i in range(rows)]
+
+    def measure(func):
+        gc.collect()
+        gc.disable()                 # like timeit: keep GC passes over big lists out of the timing
+        t0 = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - t0
+        gc.enable()
+        tracemalloc.start()          # second run, for memory only (tracemalloc is slow)
+        result = func()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return result, elapsed, size
+
+    print(f"{rows:,} rows")
+    inventory, t_zip, m_zip = measure(lambda: list(zip(item_names, item_rarity, item_weights)))
+    (names, rarity, weights), t_unzip, m_unzip = measure(lambda: tuple(zip(*inventory)))
+    print(f"  list(zip(...)) : {t_zip:7.3f}s, {m_zip / 2 ** 20:7.1f} MB")
+    print(f"  zip(*inventory): {t_unzip:7.3f}s, {m_unzip / 2 ** 20:7.1f} MB")
+    del inventory, names, rarity, weights
+
+    records, t_rec, m_rec = measure(lambda: zip_columns(names=item_names, rarity=item_rarity,
+                                                         weights=item_weights))
+    columns, t_un, _ = measure(records.unzip)
+    print(f"  zip_columns    : {t_rec:7.3f}s, {m_rec / 2 ** 20:7.1f} MB")
+    print(f"  Records.unzip  : {t_un * 1e6:7.1f}µs (same lists: {columns[0] is item_names})")
+
+    compact, t_cmp, m_cmp = measure(lambda: zip_columns(compact=True, names=item_names,
+                                                        rarity=item_rarity, weights=item_weights))
+    print(f"  compact=True   : {t_cmp:7.3f}s, {m_cmp / 2 ** 20:7.1f} MB "
+          f"(rarity and weights as arrays, {compact.rarity.dtype} / {compact.weights.dtype})")
+    print(f"  row 12,345     : {records[12_345]} == {(item_names[12_345], item_rarity[12_345], item_weights[12_345])}")
+
+
+# ------------------------------------
+# Execute
+# ------------------------------------
+if __name__ == "__main__":
+    item_names = ['Sword', 'Wooden Shield', 'Metal']
+    item_rarity = [66, 45, 12]
+    item_weights = [3.3, 5.6, 7.0]
+
+    inventory = zip_columns(names=item_names, rarity=item_rarity, weights=item_weights)
+    print(inventory[0], inventory[0].weights)          # Row(names='Sword', ...) 3.3
+    print([row.as_tuple() for row in inventory])       # same as list(zip(...))
+    print([row.names for row in inventory])            # ...and it can be iterated again
+    names, rarity, weights = inventory.unzip()         # the original lists, no copy
+    print(names, rarity, weights)
+
+    print("\n⏱️  Benchmark")
+    benchmark()
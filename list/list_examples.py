@@ -1,11 +1,13 @@
 # List Examples
 
-my_list = [1, 2, 3, 4]
-print("List:", my_list)
+# Execute:
+if __name__ == "__main__":
+    my_list = [1, 2, 3, 4]
+    print("List:", my_list)
 
-print("Second element:", my_list[1])
+    print("Second element:", my_list[1])
 
-my_list.append(5)
-print("After append:", my_list)
+    my_list.append(5)
+    print("After append:", my_list)
 
-print("Slice [1:3]:", my_list[1:3])
+    print("Slice [1:3]:", my_list[1:3])
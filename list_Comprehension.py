@@ -18,13 +18,15 @@ item → x (Takes values from range(5): 0, 1, 2, 3, 4)
 iterable → range(5) (Gives numbers 0-4)
 """
 
-# Squares
-squares = [x**2 for x in range(5)]
-print(squares)  
-
-# Filtering 
-even_nums = [x for x in range(10) if x % 2 == 0]
-print(even_nums)
-
-odd_nums = [x for x in range(10) if x % 2 !=0]
-print(odd_nums)
\ No newline at end of file
+# Execute:
+if __name__ == "__main__":
+    # Squares
+    squares = [x**2 for x in range(5)]
+    print(squares)  
+
+    # Filtering 
+    even_nums = [x for x in range(10) if x % 2 == 0]
+    print(even_nums)
+
+    odd_nums = [x for x in range(10) if x % 2 !=0]
+    print(odd_nums)
\ No newline at end of file
@@ -1,9 +1,11 @@
 # Loop Examples
 
-for i in range(3):
-    print(f"For loop iteration {i}")
+# Execute:
+if __name__ == "__main__":
+    for i in range(3):
+        print(f"For loop iteration {i}")
 
-count = 0
-while count < 3:
-    print(f"While loop count {count}")
-    count += 1
+    count = 0
+    while count < 3:
+        print(f"While loop count {count}")
+        count += 1
@@ -0,0 +1,177 @@
+# Shared Pattern Renderer
+#
+# print_pyramid (pyramid.py) and emoji_pyramid build every row from scratch
+# and call print() once per row: one write per line and a few new strings
+# per row. Here:
+#
+# - the widest row is built once; every other row is a slice of it
+#   (row i of the pyramid is row i + 1 with one space more and two glyphs less)
+# - short rows are joined into 64 KB blocks (one write each); rows longer
+#   than that are written straight from the widest row, without a copy
+# - binary sinks (and text files that have a .buffer) get encoded bytes
+#   sliced from one encoded row, so the text is never encoded row by row
+# - a glyph is any non-empty string without newlines, so multi-code-point
+#   emoji (ZWJ sequences, skin tones, flags) work; widths come from its length
+# - whole patterns up to CACHE_CHARS characters are kept in an LRU cache
+
+import functools
+import io
+import sys
+
+SHAPES = ("pyramid", "triangle")   # centered '*' pyramid / left-aligned emoji_pyramid
+BLOCK = 1 << 16                    # bytes (or characters) per write; stays in cache
+CACHE_CHARS = 1 << 22              # bigger patterns are streamed, never cached
+
+
+def _widest(levels, glyph, shape):
+    """The last (widest) row; every other row is a slice of it."""
+    if shape == "pyramid":
+        return " " * (levels - 1) + glyph * (2 * levels - 1)
+    if shape == "triangle":
+        return glyph * levels
+    raise ValueError(f"Unknown shape {shape!r}, expected one of {SHAPES}.")
+
+
+def _check_glyph(glyph):
+    if not isinstance(glyph, str) or not glyph:
+        raise ValueError("glyph must be a non-empty string.")
+    if "\n" in glyph or "\r" in glyph:
+        raise ValueError("glyph must not contain a newline.")
+
+
+def _rows(levels, shape, space=1, glyph=1):
+    """(start, stop) of every row inside the widest row; `space`/`glyph` are their sizes in it."""
+    if shape == "pyramid":
+        return (((i - 1) * space, (levels - 1) * space + (2 * i - 1) * glyph) for i in range(1, levels + 1))
+    return ((0, i * glyph) for i in range(1, levels + 1))
+
+
+def _blocks(widest, rows, newline, block_size):
+    """
+    Join rows (slices of `widest`) and newlines into blocks of about block_size.
+    Rows longer than that are passed on as they are (for bytes, a memoryview: no copy).
+    """
+    view = memoryview(widest) if isinstance(widest, bytes) else widest
+    join = type(newline)().join
+    block, size = [], 0
+    for start, stop in rows:
+        if stop - start >= block_size:
+            if block:
+                yield join(block)
+            yield view[start:stop]
+            block, size = [newline], 1          # its newline starts the next block
+            continue
+        block.append(view[start:stop])
+        block.append(newline)
+        size += stop - start + 1
+        if size >= block_size:
+            yield join(block)
+            block, size = [], 0
+    if block:
+        yield join(block)
+
+
+def pattern_size(levels, shape="pyramid", glyph="*", encoding=None):
+    """Number of characters (or bytes, with `encoding`) in a pattern: glyphs, spaces and newlines."""
+    unit = len if encoding is None else (lambda text: len(text.encode(encoding)))
+    if shape == "pyramid":
+        spaces, glyphs = levels * (levels - 1) // 2, levels * levels
+    else:
+        spaces, glyphs = 0, levels * (levels + 1) // 2
+    return spaces * unit(" ") + glyphs * unit(glyph) + levels * unit("\n")
+
+
+@functools.lru_cache(maxsize=64)
+def _render_cached(levels, glyph, shape):
+    widest = _widest(levels, glyph, shape)
+    return "".join(_blocks(widest, _rows(levels, shape, 1, len(glyph)), "\n", BLOCK))
+
+
+def render_pattern(levels, glyph="*", shape="pyramid"):
+    """The whole pattern as one string (cached unless it is very large)."""
+    _check_glyph(glyph)
+    if pattern_size(levels, shape, glyph) <= CACHE_CHARS:
+        return _render_cached(levels, glyph, shape)
+    return _render_cached.__wrapped__(levels, glyph, shape)
+
+
+def _binary_sink(file):
+    """(binary stream, encoding) to write bytes to, or None for a text-only sink."""
+    if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        return file, "utf-8"
+    buffer, encoding = getattr(file, "buffer", None), getattr(file, "encoding", None)
+    # only ASCII-compatible encodings: UTF-16/32 would need a BOM and state
+    if buffer is not None and encoding and len("\n".encode(encoding)) == 1:
+        file.flush()                       # keep earlier text output in order
+        return buffer, encoding
+    return None
+
+
+def write_pattern(levels, glyph="*", shape="pyramid", file=None, block_size=BLOCK):
+    """Write a pattern to any file-like object (stdout by default) in large blocks."""
+    file = sys.stdout if file is None else file
+    _check_glyph(glyph)
+    if pattern_size(levels, shape, glyph) <= CACHE_CHARS:
+        text = render_pattern(levels, glyph, shape)
+        sink = _binary_sink(file)
+        if sink is None:
+            file.write(text)
+        else:
+            sink[0].write(text.encode(sink[1]))
+        return
+    widest = _widest(levels, glyph, shape)
+    sink = _binary_sink(file)
+    if sink is None:
+        rows = _rows(levels, shape, 1, len(glyph))
+        out, newline = file, "\n"
+    else:
+        out, encoding = sink
+        rows = _rows(levels, shape, len(" ".encode(encoding)), len(glyph.encode(encoding)))
+        widest, newline = widest.encode(encoding), "\n".encode(encoding)
+    for block in _blocks(widest, rows, newline, block_size):
+        out.write(block)
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+def benchmark(levels=100_000):
+    """Per-row print() (the current scripts) vs write_pattern, both to /dev/null."""
+    import time
+
+    def print_pyramid_rows(levels, file):
+        for i in range(1, levels + 1):
+            print(' ' * (levels - i) + '*' * (2 * i - 1), file=file)
+
+    def emoji_pyramid_rows(levels, file, emoji="🙂"):
+        i = 1
+        while i <= levels:
+            print(emoji * i, file=file)
+            i += 1
+
+    cases = [("pyramid", "*", print_pyramid_rows), ("triangle", "🙂", emoji_pyramid_rows)]
+    with open("/dev/null", "w", encoding="utf-8") as devnull:
+        for shape, glyph, per_row in cases:
+            gb = pattern_size(levels, shape, glyph, "utf-8") / 1e9
+            t0 = time.perf_counter()
+            per_row(levels, devnull)
+            devnull.flush()
+            t_rows = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            write_pattern(levels, glyph, shape, file=devnull)
+            t_block = time.perf_counter() - t0
+            print(f"{shape:8s} {levels:,} levels ({gb:.1f} GB): per-row print {t_rows:6.2f}s, "
+                  f"write_pattern {t_block:6.2f}s")
+
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        render_pattern(500, "*")
+    print(f"render_pattern(500) x 1000 (LRU cache): {time.perf_counter() - t0:.4f}s")
+
+
+if __name__ == "__main__":
+    write_pattern(5)
+    write_pattern(5, "🙂", "triangle")
+    write_pattern(3, "👍🏽", "triangle")      # emoji + skin tone: two code points
+    print("\nBenchmark:")
+    benchmark()
@@ -1,8 +1,11 @@
 # Pyramid Pattern Example
 
-def print_pyramid(levels=5):
-    for i in range(1, levels + 1):
-        print(' ' * (levels - i) + '*' * (2 * i - 1))
+from pattern import write_pattern
+
+
+def print_pyramid(levels=5, file=None):
+    # Whole pattern in a few large writes (cached for repeated sizes), see pattern.py
+    write_pattern(levels, "*", "pyramid", file=file)
 
 if __name__ == "__main__":
     print_pyramid()
\ No newline at end of file